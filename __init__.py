@@ -1,12 +1,42 @@
 from .pyGraph import Graph
-from .pyQueue import Queue
+from .pyGraphView import GraphView
+from .pyCSRGraph import CSRGraph
+from .pyConcurrentGraph import ConcurrentGraph
+from .pyInterner import VertexInterner
+from .pyDisjointSet import DisjointSet
+from .pyParallel import multi_source_dijkstra, all_pairs_shortest_paths
+from .pyGraphIO import read_edges, load_graph, save_binary, load_binary
+from .pySharedGraph import SharedGraph, share_graph, attach_graph
+from .pyQueue import Queue, RingQueue
 from .pyStack import Stack
+from .pyPriorityQueue import PriorityQueue
+from .pyBlocking import BlockingQueue, BlockingStack, AsyncQueue, AsyncStack
 from .pyLinkedList import LinkedList
 
 
 __all__ = (
   Graph,
+  GraphView,
+  CSRGraph,
+  ConcurrentGraph,
+  VertexInterner,
+  DisjointSet,
+  multi_source_dijkstra,
+  all_pairs_shortest_paths,
+  read_edges,
+  load_graph,
+  save_binary,
+  load_binary,
+  SharedGraph,
+  share_graph,
+  attach_graph,
   Queue,
+  RingQueue,
   Stack,
+  PriorityQueue,
+  BlockingQueue,
+  BlockingStack,
+  AsyncQueue,
+  AsyncStack,
   LinkedList,
 )
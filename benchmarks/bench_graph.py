@@ -0,0 +1,208 @@
+"""benchmark every Graph algorithm on generated graph families
+
+run it like this: python benchmarks/bench_graph.py --sizes 1000,10000 --output results.json
+and check a new run against an old one with: --compare results.json
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+from graph_generators import FAMILIES
+
+
+ALGORITHMS = {
+    "bfs": lambda graph, start, target: graph.bfs(start),
+    "dfs": lambda graph, start, target: graph.dfs(start),
+    "has_path": lambda graph, start, target: graph.has_path(start, target),
+    "dijkstra": lambda graph, start, target: graph.dijkstra(start),
+    "shortest_path": lambda graph, start, target: graph.shortest_path(start, target),
+    "cycles": lambda graph, start, target: graph.cycles(),
+    "topsort": lambda graph, start, target: graph.topsort(),
+    "colorize": lambda graph, start, target: graph.colorize(),
+    "adjacency_list": lambda graph, start, target: graph.adjacency_list(),
+}
+
+# topsort needs a directed acyclic graph
+ONLY_ON = {"topsort": ("chain", "dag")}
+
+
+def measure(function, repeat: int):
+    """time a function and find its peak memory
+
+    Args:
+        function (callable): the function to measure
+        repeat (int): number of timed runs, the fastest one is kept
+
+    Returns:
+        tuple: (seconds, peak memory in bytes)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    # tracemalloc slows the code down, so memory is measured in a separate run
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def scaling_exponent(points):
+    """fit time = c * edges ^ k with least squares on a log-log scale
+
+    Args:
+        points (list): (edges, seconds) pairs
+
+    Returns:
+        float: k, None if there are fewer than 2 usable points
+    """
+    points = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run(families, algorithms, sizes, repeat: int, seed: int):
+    """run the benchmarks
+
+    Args:
+        families (list): names of graph families
+        algorithms (list): names of algorithms
+        sizes (list): numbers of edges
+        repeat (int): number of timed runs of each measurement
+        seed (int): random seed of the generators
+
+    Returns:
+        dict: the report, see main
+    """
+    results = []
+    for family in families:
+        for size in sizes:
+            graph = FAMILIES[family](size, seed)
+            start = graph.maximum()["vertex"]
+            # the last vertex BFS reaches is a far away target
+            target = graph.bfs(start)[-1]
+            for name in algorithms:
+                if family not in ONLY_ON.get(name, (family,)):
+                    continue
+                seconds, peak = measure(lambda: ALGORITHMS[name](graph, start, target), repeat)
+                results.append({
+                    "family": family,
+                    "algorithm": name,
+                    "edges": graph.q,
+                    "vertices": graph.p,
+                    "time": seconds,
+                    "peak_memory": peak,
+                })
+                print(f"{family:>12} {name:>15} {graph.q:>9} edges {seconds:10.4f}s {peak / 2 ** 20:9.2f}MiB",
+                      file=sys.stderr)
+
+    scaling = {}
+    for family in families:
+        for name in algorithms:
+            points = [(r["edges"], r["time"]) for r in results if r["family"] == family and r["algorithm"] == name]
+            exponent = scaling_exponent(points)
+            if exponent is not None:
+                scaling[f"{family}/{name}"] = exponent
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+        "scaling": scaling,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float):
+    """compare the times of two reports
+
+    Args:
+        report (dict): the new report
+        baseline (dict): the old report
+        threshold (float): a time ratio above this is a regression
+
+    Returns:
+        list: a dict for each measurement found in both reports, with its time ratio and regression flag
+    """
+    old = {(r["family"], r["algorithm"], r["edges"]): r for r in baseline["results"]}
+    comparison = []
+    for r in report["results"]:
+        key = (r["family"], r["algorithm"], r["edges"])
+        if key not in old or old[key]["time"] == 0:
+            continue
+        ratio = r["time"] / old[key]["time"]
+        comparison.append({
+            "family": r["family"],
+            "algorithm": r["algorithm"],
+            "edges": r["edges"],
+            "ratio": ratio,
+            "regression": ratio > threshold,
+        })
+    return comparison
+
+
+def main(argv=None):
+    """parse the command line, run the benchmarks and print the JSON report
+
+    Args:
+        argv (list): command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: exit code, 1 if a regression was found by --compare
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="comma separated numbers of edges")
+    parser.add_argument("--families", default=",".join(FAMILIES), help="comma separated graph families")
+    parser.add_argument("--algorithms", default=",".join(ALGORITHMS), help="comma separated algorithms")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each measurement")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the generators")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="a JSON report of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.5, help="time ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    families = args.families.split(",")
+    algorithms = args.algorithms.split(",")
+    for name in families:
+        if name not in FAMILIES:
+            parser.error(f"unknown family {name!r}")
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name!r}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    report = run(families, algorithms, sizes, args.repeat, args.seed)
+    regressions = False
+    if args.compare:
+        with open(args.compare) as file:
+            report["comparison"] = compare(report, json.load(file), args.threshold)
+        regressions = any(c["regression"] for c in report["comparison"])
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
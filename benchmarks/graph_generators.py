@@ -0,0 +1,131 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyGraph import Graph  # noqa: E402
+
+
+def _weight(rng: random.Random):
+    """pick a random edge weight
+
+    Args:
+        rng (Random): the random generator
+
+    Returns:
+        int: a weight between 1 and 10
+    """
+    return rng.randint(1, 10)
+
+
+def erdos_renyi(edges: int, seed: int = 0, average_degree: int = 4):
+    """make a random directed G(n, m) graph
+
+    Args:
+        edges (int): number of edges
+        seed (int): random seed. Defaults to 0.
+        average_degree (int): edges per vertex, sets the number of vertices. Defaults to 4.
+
+    Returns:
+        Graph: the graph
+    """
+    rng = random.Random(seed)
+    n = max(edges // average_degree, int(edges ** 0.5) + 2)
+    e = set()
+    while len(e) < edges:
+        e.add((rng.randrange(n), rng.randrange(n), _weight(rng)))
+    return Graph(set(range(n)), e, "d")
+
+
+def power_law(edges: int, seed: int = 0, per_vertex: int = 4):
+    """make a directed graph with a power-law degree distribution by preferential attachment (Barabasi-Albert)
+
+    Args:
+        edges (int): about how many edges
+        seed (int): random seed. Defaults to 0.
+        per_vertex (int): edges each new vertex adds to older ones. Defaults to 4.
+
+    Returns:
+        Graph: the graph
+    """
+    rng = random.Random(seed)
+    n = max(edges // per_vertex, per_vertex + 1)
+    # each vertex appears here once per edge it has, so picking from it prefers hubs.
+    # edges go from the older vertex to the new one so traversals from a hub reach most of the graph
+    endpoints = list(range(per_vertex))
+    e = set()
+    for vertex in range(per_vertex, n):
+        targets = {rng.choice(endpoints) for _ in range(per_vertex)}
+        for target in targets:
+            e.add((target, vertex, _weight(rng)))
+            endpoints.append(target)
+        endpoints.extend([vertex] * len(targets))
+    return Graph(set(range(n)), e, "d")
+
+
+def grid(edges: int, seed: int = 0):
+    """make an undirected square grid graph
+
+    Args:
+        edges (int): about how many edges
+        seed (int): random seed for the weights. Defaults to 0.
+
+    Returns:
+        Graph: the graph, vertices are (row, column) tuples
+    """
+    rng = random.Random(seed)
+    side = max(int((edges / 2) ** 0.5), 2)
+    v = {(i, j) for i in range(side) for j in range(side)}
+    e = set()
+    for i in range(side):
+        for j in range(side):
+            if i + 1 < side:
+                e.add(((i, j), (i + 1, j), _weight(rng)))
+            if j + 1 < side:
+                e.add(((i, j), (i, j + 1), _weight(rng)))
+    return Graph(v, e, "ud")
+
+
+def chain(edges: int, seed: int = 0):
+    """make a directed path 0 -> 1 -> ... -> edges, the worst case for recursive algorithms
+
+    Args:
+        edges (int): number of edges
+        seed (int): random seed for the weights. Defaults to 0.
+
+    Returns:
+        Graph: the graph
+    """
+    rng = random.Random(seed)
+    return Graph(set(range(edges + 1)), {(i, i + 1, _weight(rng)) for i in range(edges)}, "d")
+
+
+def dag(edges: int, seed: int = 0, average_degree: int = 4):
+    """make a random directed acyclic graph, every edge goes from a smaller vertex to a bigger one
+
+    Args:
+        edges (int): number of edges
+        seed (int): random seed. Defaults to 0.
+        average_degree (int): edges per vertex, sets the number of vertices. Defaults to 4.
+
+    Returns:
+        Graph: the graph
+    """
+    rng = random.Random(seed)
+    n = max(edges // average_degree, int((2 * edges) ** 0.5) + 2)
+    e = set()
+    while len(e) < edges:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            e.add((min(a, b), max(a, b), _weight(rng)))
+    return Graph(set(range(n)), e, "d")
+
+
+FAMILIES = {
+    "erdos_renyi": erdos_renyi,
+    "power_law": power_law,
+    "grid": grid,
+    "chain": chain,
+    "dag": dag,
+}
@@ -0,0 +1,38 @@
+import asyncio
+from itertools import islice
+
+
+async def cooperate(iterator, step: int = 1000, timeout: float = None, guard=None):
+    """run a lazy algorithm inside an event loop without blocking it
+
+    Args:
+        iterator (iterator): the algorithm, every item it gives is one step of work
+        step (int): number of items taken before control goes back to the event loop. Defaults to 1000.
+        timeout (float): seconds the whole run may take. Defaults to None.
+        guard (callable): called after every pause, before the iterator goes on, it raises to stop a run
+            that other tasks made invalid. Defaults to None.
+
+    Raises:
+        TimeoutError: if the run takes longer than timeout
+        CancelledError: if the task running it is cancelled, the algorithm stops at the next pause
+
+    Yields:
+        list: the next items of the iterator, at most step of them
+    """
+    if step < 1:
+        raise ValueError("step should be at least 1")
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    iterator = iter(iterator)
+    while True:
+        chunk = list(islice(iterator, step))
+        if chunk:
+            yield chunk
+        if len(chunk) < step:
+            return
+        # the pause is where other tasks run and where cancellation reaches us
+        await asyncio.sleep(0)
+        if deadline is not None and loop.time() > deadline:
+            raise TimeoutError(f"graph algorithm took longer than {timeout} seconds")
+        if guard is not None:
+            guard()
@@ -0,0 +1,331 @@
+import asyncio
+from threading import Condition, Lock
+
+from pyStack import Stack
+from pyQueue import RingQueue
+
+
+class _Blocking:
+    """the thread-safe blocking buffer behind BlockingQueue and BlockingStack
+    """
+
+    def __init__(self, capacity: int = None):
+        """Define needed variables for other methods
+
+        Args:
+            capacity (int): the most elements it can hold, put waits while it is full. None means no limit. Defaults to None.
+        """
+        self._store = self._store_type()
+        self.capacity = capacity
+        self.closed = False
+        lock = Lock()
+        self._not_empty = Condition(lock)
+        self._not_full = Condition(lock)
+
+    def _has_room(self):
+        return self.closed or self.capacity is None or self._store.length < self.capacity
+
+    def _has_items(self):
+        return self.closed or self._store.length > 0
+
+    def put(self, value, timeout: float = None):
+        """put a new element, wait while the buffer is full
+
+        Args:
+            value (any): the new element
+            timeout (float): seconds to wait for room, None waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if there was no room before timeout
+            ValueError: if the buffer is closed
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout):
+                raise TimeoutError("no room in the buffer")
+            if self.closed:
+                raise ValueError("can't 'put' to a closed buffer")
+            self._store.put(value)
+            self._not_empty.notify()
+
+    def get(self, timeout: float = None):
+        """give you the next element and remove it, wait while the buffer is empty
+
+        Args:
+            timeout (float): seconds to wait for an element, None waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if no element came before timeout
+            IndexError: if the buffer is closed and empty, no element will ever come
+
+        Returns:
+            any: the element
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError("no element in the buffer")
+            if not self._store.length:
+                raise IndexError("can't 'get' from a closed and empty buffer")
+            value = self._store.get()
+            self._not_full.notify()
+            return value
+
+    def get_many(self, max_items: int, timeout: float = None):
+        """wait for at least one element and take up to max_items of them under one lock
+
+        Args:
+            max_items (int): the most elements to take
+            timeout (float): seconds to wait for the first element, None waits forever. Defaults to None.
+
+        Raises:
+            ValueError: if max_items was smaller than 1
+            TimeoutError: if no element came before timeout
+
+        Returns:
+            list: the elements in get order, empty only when the buffer is closed and empty
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError("no element in the buffer")
+            store = self._store
+            values = [store.get() for _ in range(min(max_items, store.length))]
+            self._not_full.notify(len(values))
+            return values
+
+    def drain(self):
+        """take every element that is in the buffer now, without waiting
+
+        Returns:
+            list: the elements in get order
+        """
+        with self._not_empty:
+            store = self._store
+            values = [store.get() for _ in range(store.length)]
+            self._not_full.notify_all()
+            return values
+
+    def close(self):
+        """stop accepting elements. getters take what is left and then get IndexError, waiters wake up
+        """
+        with self._not_empty:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def is_empty(self):
+        """check the buffer is empty or not
+
+        Returns:
+            boolean: if it was True, the buffer is empty
+        """
+        return not self._store.length
+
+    def is_full(self):
+        """check the buffer has capacity elements
+
+        Returns:
+            boolean: if it was True, put will wait
+        """
+        return self._store.length == self.capacity
+
+    def __len__(self):
+        return self._store.length
+
+
+class BlockingQueue(_Blocking):
+    """a class for a thread-safe FIFO queue between producer and consumer threads
+        you can define it like this: NAME = BlockingQueue() or NAME = BlockingQueue(CAPACITY)
+    """
+
+    _store_type = RingQueue
+
+
+class BlockingStack(_Blocking):
+    """a class for a thread-safe LIFO stack between producer and consumer threads
+        you can define it like this: NAME = BlockingStack() or NAME = BlockingStack(CAPACITY)
+    """
+
+    _store_type = Stack
+
+
+class _AsyncBlocking:
+    """the asyncio buffer behind AsyncQueue and AsyncStack, for tasks of one event loop
+    """
+
+    def __init__(self, capacity: int = None):
+        """Define needed variables for other methods
+
+        Args:
+            capacity (int): the most elements it can hold, put waits while it is full. None means no limit. Defaults to None.
+        """
+        self._store = self._store_type()
+        self.capacity = capacity
+        self.closed = False
+        self._getters = []  # futures of tasks waiting for an element
+        self._putters = []  # futures of tasks waiting for room
+
+    def _has_room(self):
+        return self.closed or self.capacity is None or self._store.length < self.capacity
+
+    def _has_items(self):
+        return self.closed or self._store.length > 0
+
+    @staticmethod
+    def _wake(waiters: list, count: int = 1):
+        """wake up to count waiting tasks
+
+        Args:
+            waiters (list): the futures they wait on
+            count (int): number of tasks. Defaults to 1.
+        """
+        while waiters and count:
+            future = waiters.pop(0)
+            if not future.done():
+                future.set_result(None)
+                count -= 1
+
+    async def _wait(self, waiters: list, ready, timeout: float = None):
+        """wait until ready() is True
+
+        Args:
+            waiters (list): the futures of tasks waiting for the same thing
+            ready (callable): the condition
+            timeout (float): seconds to wait, None waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if ready() was still False after timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready():
+            future = loop.create_future()
+            waiters.append(future)
+            try:
+                if deadline is None:
+                    await future
+                else:
+                    await asyncio.wait_for(future, max(deadline - loop.time(), 0))
+            except BaseException as error:
+                # a cancelled or timed out task passes on a wake-up it already got
+                if future.done() and not future.cancelled():
+                    self._wake(waiters)
+                elif future in waiters:
+                    waiters.remove(future)
+                if isinstance(error, asyncio.TimeoutError):
+                    # before python 3.11 it isn't the builtin TimeoutError that BlockingQueue raises
+                    raise TimeoutError("no room in the buffer" if waiters is self._putters
+                                       else "no element in the buffer") from None
+                raise
+
+    async def put(self, value, timeout: float = None):
+        """put a new element, wait while the buffer is full
+
+        Args:
+            value (any): the new element
+            timeout (float): seconds to wait for room, None waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if there was no room before timeout
+            ValueError: if the buffer is closed
+        """
+        await self._wait(self._putters, self._has_room, timeout)
+        if self.closed:
+            raise ValueError("can't 'put' to a closed buffer")
+        self._store.put(value)
+        self._wake(self._getters)
+
+    async def get(self, timeout: float = None):
+        """give you the next element and remove it, wait while the buffer is empty
+
+        Args:
+            timeout (float): seconds to wait for an element, None waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if no element came before timeout
+            IndexError: if the buffer is closed and empty, no element will ever come
+
+        Returns:
+            any: the element
+        """
+        await self._wait(self._getters, self._has_items, timeout)
+        if not self._store.length:
+            raise IndexError("can't 'get' from a closed and empty buffer")
+        value = self._store.get()
+        self._wake(self._putters)
+        return value
+
+    async def get_many(self, max_items: int, timeout: float = None):
+        """wait for at least one element and take up to max_items of them at once
+
+        Args:
+            max_items (int): the most elements to take
+            timeout (float): seconds to wait for the first element, None waits forever. Defaults to None.
+
+        Raises:
+            ValueError: if max_items was smaller than 1
+            TimeoutError: if no element came before timeout
+
+        Returns:
+            list: the elements in get order, empty only when the buffer is closed and empty
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        await self._wait(self._getters, self._has_items, timeout)
+        store = self._store
+        values = [store.get() for _ in range(min(max_items, store.length))]
+        self._wake(self._putters, len(values))
+        return values
+
+    def drain(self):
+        """take every element that is in the buffer now, without waiting
+
+        Returns:
+            list: the elements in get order
+        """
+        store = self._store
+        values = [store.get() for _ in range(store.length)]
+        self._wake(self._putters, len(values))
+        return values
+
+    def close(self):
+        """stop accepting elements. getters take what is left and then get IndexError, waiters wake up
+        """
+        self.closed = True
+        self._wake(self._getters, len(self._getters))
+        self._wake(self._putters, len(self._putters))
+
+    def is_empty(self):
+        """check the buffer is empty or not
+
+        Returns:
+            boolean: if it was True, the buffer is empty
+        """
+        return not self._store.length
+
+    def is_full(self):
+        """check the buffer has capacity elements
+
+        Returns:
+            boolean: if it was True, put will wait
+        """
+        return self._store.length == self.capacity
+
+    def __len__(self):
+        return self._store.length
+
+
+class AsyncQueue(_AsyncBlocking):
+    """a class for an asyncio FIFO queue between producer and consumer tasks
+        you can define it like this: NAME = AsyncQueue() or NAME = AsyncQueue(CAPACITY)
+    """
+
+    _store_type = RingQueue
+
+
+class AsyncStack(_AsyncBlocking):
+    """a class for an asyncio LIFO stack between producer and consumer tasks
+        you can define it like this: NAME = AsyncStack() or NAME = AsyncStack(CAPACITY)
+    """
+
+    _store_type = Stack
@@ -0,0 +1,394 @@
+from array import array
+from heapq import heappop, heappush
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, level_bfs falls back to plain python
+    np = None
+
+from pyStack import Stack
+
+
+class CSRGraph:
+    """a class for saving a read-only graph in compressed sparse row (CSR) form
+        you can make one from a graph like this: NAME = GRAPH.freeze()
+    """
+
+    def __init__(self, vertices, graph_type: str, offsets, targets, weights, in_degrees, out_degrees):
+        """Define needed variables for other methods
+
+        Args:
+            vertices (sequence): vertex labels, the index of a label is its dense id
+            graph_type (str): "d" for directed and "ud" for undirected graphs
+            offsets (sequence): neighbors of vertex i are targets[offsets[i]:offsets[i + 1]]
+            targets (sequence): dense ids of the neighbors of all vertices, row after row
+            weights (sequence): weight of each entry of targets
+            in_degrees (sequence): in-degree of each vertex
+            out_degrees (sequence): out-degree of each vertex
+
+        Raises:
+            ValueError: If you give wrong type to the class this error raise with 'Unknown type of graph' message
+
+        Description:
+            the buffers can be arrays, memoryviews or any other indexable sequence of numbers
+        """
+        if graph_type.lower() in ("ud", "d"):
+            self.type = graph_type.lower()
+        else:
+            raise ValueError("Unknown type of graph")
+        self.V = tuple(vertices)
+        self.ids = {vertex: i for i, vertex in enumerate(self.V)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.in_degrees = in_degrees
+        self.out_degrees = out_degrees
+        self.p = len(self.V)
+        if self.type == "d":
+            self.q = len(targets)
+        else:
+            self.q = sum(out_degrees) // 2
+        self.empty = self.q == 0
+
+    def _row(self, i: int):
+        """return the slice bounds of a vertex row in targets and weights
+
+        Args:
+            i (int): dense id of the vertex
+
+        Returns:
+            tuple: start and end of the row
+        """
+        return self.offsets[i], self.offsets[i + 1]
+
+    def out_deg(self, vertex: int):
+        """return the out-degree of a vertex
+
+        Args:
+            vertex (int): vertex label
+
+        Returns:
+            int: number of edges that leave the vertex
+        """
+        return self.out_degrees[self.ids[vertex]]
+
+    def in_deg(self, vertex: int):
+        """return the in-degree of a vertex
+
+        Args:
+            vertex (int): vertex label
+
+        Returns:
+            int: number of edges that enter the vertex
+        """
+        return self.in_degrees[self.ids[vertex]]
+
+    def neighboring_vertices(self, vertex: int):
+        """return neighbors of a vertex
+
+        Args:
+            vertex (int): vertex label
+
+        Returns:
+            list: a list of neighboring vertices of the vertex
+        """
+        start, end = self._row(self.ids[vertex])
+        labels = self.V
+        return [labels[t] for t in self.targets[start:end]]
+
+    def weight(self, edge: tuple):
+        """find the weight of an edge
+
+        Args:
+            edge (tuple): a (start, end) tuple
+
+        Returns:
+            int: the weight of the edge, None if there isn't such an edge
+        """
+        i, j = self.ids[edge[0]], self.ids[edge[1]]
+        best = None
+        start, end = self._row(i)
+        for k in range(start, end):
+            if self.targets[k] == j and (best is None or self.weights[k] < best):
+                best = self.weights[k]
+        return best
+
+    def bfs(self, vertex: int):
+        """explore the graph and return the order of visiting with BFS
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            vertex (int): start vertex
+
+        Returns:
+            list: a list of BFS visiting order
+        """
+        offsets, targets = self.offsets, self.targets
+        source = self.ids[vertex]
+        seen = bytearray(self.p)
+        seen[source] = 1
+        # the visiting order is also the queue, i points to its head
+        order = [source]
+        i = 0
+        while i < len(order):
+            v = order[i]
+            i += 1
+            for t in targets[offsets[v]:offsets[v + 1]]:
+                if not seen[t]:
+                    seen[t] = 1
+                    order.append(t)
+        labels = self.V
+        return [labels[v] for v in order]
+
+    def dfs(self, vertex: int):
+        """explore the graph and return the order of visiting with DFS.
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            vertex (int): the start vertex of exploring
+
+        Returns:
+            Stack: a stack of DFS finishing order, the start vertex is on top
+        """
+        offsets, targets = self.offsets, self.targets
+        source = self.ids[vertex]
+        seen = bytearray(self.p)
+        seen[source] = 1
+        order = Stack()
+        # each frame is a vertex and the position of its next unexplored edge
+        frames = [[source, offsets[source]]]
+        while frames:
+            frame = frames[-1]
+            v, k = frame
+            if k < offsets[v + 1]:
+                frame[1] = k + 1
+                t = targets[k]
+                if not seen[t]:
+                    seen[t] = 1
+                    frames.append([t, offsets[t]])
+            else:
+                frames.pop()
+                order.push(self.V[v])
+        return order
+
+    def level_bfs(self, sources, max_depth: int = None, callback=None):
+        """explore the graph with BFS one whole level at a time, with numpy array operations when numpy is installed
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            sources (iterable): start vertices, all of them have depth 0
+            max_depth (int): don't go further than this many edges from the sources. Defaults to None.
+            callback (callable): called as callback(depth, frontier) before each level is expanded, frontier
+                holds the ids of the vertices at that depth. if it returns True the search stops. Defaults to None.
+
+        Returns:
+            tuple: (vertices, dist, parent). dist[i] is the number of edges between the sources and
+                vertices[i], parent[i] is the id of the vertex before it on such a path. both are -1
+                for unreached vertices and parent is -1 for the sources. the arrays are numpy arrays
+                when numpy is installed, otherwise int64 arrays
+
+        Description:
+            with numpy, frontier is a sorted numpy array of ids and each level costs a few array
+            operations instead of a python loop over its edges
+        """
+        frontier = sorted({self.ids[vertex] for vertex in sources})
+        if np is None:
+            return self.V, *self._level_bfs_python(frontier, max_depth, callback)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        targets = np.asarray(self.targets, dtype=np.int64)
+        dist = np.full(self.p, -1, dtype=np.int64)
+        parent = np.full(self.p, -1, dtype=np.int64)
+        frontier = np.array(frontier, dtype=np.int64)
+        dist[frontier] = 0
+        depth = 0
+        while frontier.size:
+            if callback is not None and callback(depth, frontier):
+                break
+            if max_depth is not None and depth >= max_depth:
+                break
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # positions of every edge of the frontier in targets, row after row
+            row_starts = np.cumsum(counts) - counts
+            positions = np.arange(total, dtype=np.int64) + np.repeat(starts - row_starts, counts)
+            neighbors = targets[positions]
+            origins = np.repeat(frontier, counts)
+            new = dist[neighbors] == -1
+            # a vertex reached from many frontier vertices keeps the first one as its parent
+            frontier, first = np.unique(neighbors[new], return_index=True)
+            depth += 1
+            dist[frontier] = depth
+            parent[frontier] = origins[new][first]
+        return self.V, dist, parent
+
+    def _level_bfs_python(self, frontier: list, max_depth: int = None, callback=None):
+        """level_bfs without numpy
+
+        Args:
+            frontier (list): sorted ids of the sources
+            max_depth (int): see level_bfs. Defaults to None.
+            callback (callable): see level_bfs. Defaults to None.
+
+        Returns:
+            tuple: (dist, parent) int64 arrays
+        """
+        offsets, targets = self.offsets, self.targets
+        dist = array("q", [-1]) * self.p
+        parent = array("q", [-1]) * self.p
+        for v in frontier:
+            dist[v] = 0
+        depth = 0
+        while frontier:
+            if callback is not None and callback(depth, frontier):
+                break
+            if max_depth is not None and depth >= max_depth:
+                break
+            depth += 1
+            next_frontier = []
+            for v in frontier:
+                for t in targets[offsets[v]:offsets[v + 1]]:
+                    if dist[t] == -1:
+                        dist[t] = depth
+                        parent[t] = v
+                        next_frontier.append(t)
+            next_frontier.sort()
+            frontier = next_frontier
+        return dist, parent
+
+    def has_path(self, start: int, target: int):
+        """check there is a path between start and target vertex using DFS.
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            start (int): starting vertex
+            target (int): ending vertex
+
+        Returns:
+            boolean: a boolean value to show there is a path or not
+        """
+        offsets, targets = self.offsets, self.targets
+        source, goal = self.ids[start], self.ids[target]
+        if source == goal:
+            return True
+        seen = bytearray(self.p)
+        seen[source] = 1
+        stack = [source]
+        while stack:
+            v = stack.pop()
+            for t in targets[offsets[v]:offsets[v + 1]]:
+                if t == goal:
+                    return True
+                if not seen[t]:
+                    seen[t] = 1
+                    stack.append(t)
+        return False
+
+    def _search(self, source: int, goal: int = -1):
+        """run a heap based dijkstra on dense ids
+
+        Args:
+            source (int): dense id of the source vertex
+            goal (int): stop as soon as this id is settled. Defaults to -1.
+
+        Returns:
+            tuple: (dist, prev) lists indexed by dense id, prev is -1 for unreached vertices
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        inf = float("inf")
+        dist = [inf] * self.p
+        prev = [-1] * self.p
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, v = heappop(heap)
+            if d > dist[v]:
+                continue  # a stale entry, v was reached cheaper later
+            if v == goal:
+                break
+            for k in range(offsets[v], offsets[v + 1]):
+                t = targets[k]
+                new_dist = d + weights[k]
+                if new_dist < dist[t]:
+                    dist[t] = new_dist
+                    prev[t] = v
+                    heappush(heap, (new_dist, t))
+        return dist, prev
+
+    def dijkstra(self, start: int, target: int = None):
+        """A SSSP dijkstra to find the shortest path
+            algorithm time complexity = O((V + E) * log(V))
+            algorithm space complexity = O(V)
+            WARNING : This algorithm won't work for negative edge weight
+
+        Args:
+            start (int): the source vertex
+            target (int): if given, the search stops as soon as target is settled. Defaults to None.
+
+        Returns:
+            dict: the distance dict in dijkstra algorithm
+        """
+        goal = -1 if target is None else self.ids[target]
+        dist, prev = self._search(self.ids[start], goal)
+        labels = self.V
+        return {
+            labels[i]: {"dist": dist[i], "prev": None if prev[i] == -1 else labels[prev[i]]}
+            for i in range(self.p)
+        }
+
+    def shortest_path(self, start: int, target: int):
+        """finding the shortest path between to vertex with dijkstra method
+
+        Args:
+            start (int): the source vertex
+            target (int): the end vertex
+
+        Returns:
+            list: a list that has the shortest path, empty if target isn't reachable from start
+        """
+        source, goal = self.ids[start], self.ids[target]
+        dist, prev = self._search(source, goal)
+        if dist[goal] == float("inf"):
+            return []
+        path = []
+        v = goal
+        while v != -1:
+            path.append(self.V[v])
+            v = prev[v]
+        path.reverse()
+        return path
+
+    def topsort(self):
+        """find the topological order of the graph with Kahn's algorithms
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Raises:
+            TypeError: none directed acyclic graphs don't have topological order
+
+        Returns:
+            list: a list of the graph's topological order
+        """
+        if self.type != "d":
+            raise TypeError("your graph isn't directed acyclic graph")
+        offsets, targets = self.offsets, self.targets
+        in_degrees = array("q", self.in_degrees)
+        order = [i for i in range(self.p) if in_degrees[i] == 0]
+        i = 0
+        while i < len(order):
+            v = order[i]
+            i += 1
+            for t in targets[offsets[v]:offsets[v + 1]]:
+                in_degrees[t] -= 1
+                if in_degrees[t] == 0:
+                    order.append(t)
+        if len(order) != self.p:
+            raise TypeError("your graph isn't directed acyclic graph")
+        labels = self.V
+        return [labels[v] for v in order]
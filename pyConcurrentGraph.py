@@ -0,0 +1,179 @@
+from contextlib import contextmanager
+from threading import RLock
+
+from pyGraph import Graph
+
+
+class ConcurrentGraph:
+    """a class for a graph that one or more writer threads change while many reader threads query it
+        you can define it like this: NAME = ConcurrentGraph(VERTICES-SET, EDGES-SET, GRAPH-TYPE)
+        readers use immutable snapshots without locks, writers batch their changes and publish them at once
+    """
+
+    def __init__(self, v: set, e: set, graph_type: str, batch_size: int = 1024):
+        """Define needed variables for other methods
+
+        Args:
+            v (set): A set of graph vertices
+            e (set): A set of graph edges
+            graph_type (str): A string for defining the graphs type, see Graph
+            batch_size (int): changes that are published together, 1 publishes every change. Defaults to 1024.
+
+        Raises:
+            ValueError: If you give wrong type to the class this error raise with 'Unknown type of graph' message
+        """
+        self._graph = Graph(v, e, graph_type)  # only touched by writers, under _lock
+        self._lock = RLock()
+        self._batch_depth = 0
+        self._pending = 0  # changes that readers can't see yet
+        self.batch_size = batch_size
+        self.type = self._graph.type
+        self._published = (0, self._graph.freeze())  # (version, snapshot), replaced in one assignment
+
+    def snapshot(self):
+        """return the latest published snapshot, it never changes so it can be used without locks
+
+        Returns:
+            CSRGraph: the graph as it was at the last publish
+        """
+        return self._published[1]
+
+    @property
+    def version(self):
+        """number of publishes so far, it grows with every new snapshot
+        """
+        return self._published[0]
+
+    def versioned_snapshot(self):
+        """return the latest published snapshot with its version
+
+        Returns:
+            tuple: (version, CSRGraph)
+        """
+        return self._published
+
+    def publish(self):
+        """make every change so far visible to readers
+            algorithm time complexity = O(V + E)
+
+        Returns:
+            int: the version of the new snapshot, or of the current one if nothing changed
+        """
+        with self._lock:
+            if self._pending:
+                snapshot = self._graph.freeze()
+                # readers see the old tuple or the new one, never a half made snapshot
+                self._published = (self._published[0] + 1, snapshot)
+                self._pending = 0
+            return self._published[0]
+
+    def _changed(self, count: int):
+        """count changes and publish when a batch is full
+
+        Args:
+            count (int): number of changes
+        """
+        self._pending += count
+        if self._batch_depth == 0 and self._pending >= self.batch_size:
+            self.publish()
+
+    @contextmanager
+    def batch(self):
+        """hold the writer lock for a block of changes and publish them together at the end
+
+        Yields:
+            ConcurrentGraph: this graph
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.publish()
+
+    def add_edge(self, edge: tuple):
+        """add an edge, readers see it after the next publish
+
+        Args:
+            edge (tuple): the new edge
+
+        Raises:
+            NameError: if the vertices wasn't in v this error will raise
+        """
+        with self._lock:
+            version = self._graph.version
+            self._graph.add_edge(edge)
+            self._changed(self._graph.version - version)
+
+    def add_edges(self, edges):
+        """add many edges, readers see them after the next publish
+
+        Args:
+            edges (iterable): the new edges
+
+        Raises:
+            NameError: if a vertex of the batch wasn't in v this error will raise
+        """
+        with self._lock:
+            q = self._graph.q
+            self._graph.add_edges(edges)
+            self._changed(self._graph.q - q)
+
+    def add_vertex(self, vertex: int):
+        """add a vertex, readers see it after the next publish
+
+        Args:
+            vertex (int): new vertex
+        """
+        with self._lock:
+            version = self._graph.version
+            self._graph.add_vertex(vertex)
+            self._changed(self._graph.version - version)
+
+    def add_vertices(self, vertices):
+        """add many vertices, readers see them after the next publish
+
+        Args:
+            vertices (iterable): the new vertices
+        """
+        with self._lock:
+            p = self._graph.p
+            self._graph.add_vertices(vertices)
+            self._changed(self._graph.p - p)
+
+    def neighboring_vertices(self, vertex: int):
+        """return neighbors of a vertex in the latest snapshot, see CSRGraph.neighboring_vertices
+        """
+        return self.snapshot().neighboring_vertices(vertex)
+
+    def bfs(self, vertex: int):
+        """run BFS on the latest snapshot, see CSRGraph.bfs
+        """
+        return self.snapshot().bfs(vertex)
+
+    def dfs(self, vertex: int):
+        """run DFS on the latest snapshot, see CSRGraph.dfs
+        """
+        return self.snapshot().dfs(vertex)
+
+    def has_path(self, start: int, target: int):
+        """check for a path in the latest snapshot, see CSRGraph.has_path
+        """
+        return self.snapshot().has_path(start, target)
+
+    def dijkstra(self, start: int, target: int = None):
+        """run dijkstra on the latest snapshot, see CSRGraph.dijkstra
+        """
+        return self.snapshot().dijkstra(start, target)
+
+    def shortest_path(self, start: int, target: int):
+        """find a shortest path in the latest snapshot, see CSRGraph.shortest_path
+        """
+        return self.snapshot().shortest_path(start, target)
+
+    def topsort(self):
+        """sort the latest snapshot topologically, see CSRGraph.topsort
+        """
+        return self.snapshot().topsort()
@@ -0,0 +1,98 @@
+class DisjointSet:
+    """a class for union-find over dense integer ids (0, 1, 2, ...) with path compression and union by rank
+        you can define a disjoint set like this: NAME = DisjointSet(SIZE)
+    """
+
+    def __init__(self, size: int = 0):
+        """Define needed variables for other methods
+
+        Args:
+            size (int): number of ids to start with, each one in its own set. Defaults to 0.
+        """
+        self.parent = list(range(size))  # id -> parent id, roots are their own parent
+        self.rank = [0] * size  # root id -> upper bound of its tree height
+        self.size = [1] * size  # root id -> number of ids in its set
+        self.count = size  # number of sets
+
+    def add(self):
+        """add a new id in its own set
+
+        Returns:
+            int: the new id
+        """
+        i = len(self.parent)
+        self.parent.append(i)
+        self.rank.append(0)
+        self.size.append(1)
+        self.count += 1
+        return i
+
+    def find(self, i: int):
+        """find the root of the set of an id
+            algorithm time complexity = O(α(n)) amortized
+
+        Args:
+            i (int): the id
+
+        Returns:
+            int: the root id, the same for every id of the set
+        """
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # path compression: point everything on the way straight at the root
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i: int, j: int):
+        """merge the sets of two ids
+            algorithm time complexity = O(α(n)) amortized
+
+        Args:
+            i (int): an id
+            j (int): another id
+
+        Returns:
+            boolean: True if they were in different sets
+        """
+        i = self.find(i)
+        j = self.find(j)
+        if i == j:
+            return False
+        rank = self.rank
+        if rank[i] < rank[j]:
+            i, j = j, i
+        self.parent[j] = i
+        self.size[i] += self.size[j]
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, i: int, j: int):
+        """check two ids are in the same set
+
+        Args:
+            i (int): an id
+            j (int): another id
+
+        Returns:
+            boolean: True if they are in the same set
+        """
+        return self.find(i) == self.find(j)
+
+    def set_size(self, i: int):
+        """return the number of ids in the set of an id
+
+        Args:
+            i (int): the id
+
+        Returns:
+            int: the size of the set
+        """
+        return self.size[self.find(i)]
+
+    def __len__(self):
+        return len(self.parent)
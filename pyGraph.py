@@ -1,9 +1,30 @@
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from heapq import heapify, heappop, heappush, nlargest
+from itertools import chain
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, plain arrays are used without it
+    np = None
+
 from pyStack import Stack
-from pyQueue import Queue
+from pyCSRGraph import CSRGraph
+from pyProfiler import GraphProfiler, profiled
+from pyInterner import VertexInterner
+from pyDisjointSet import DisjointSet
+from pyParallel import all_pairs_shortest_paths, multi_source_dijkstra
+from pyAsync import cooperate
 
 
 __version__ = 1
 
+_END = object()  # marks an exhausted iterator
+
+COLORING_STRATEGIES = ("greedy", "largest_first", "smallest_last", "dsatur")
+
 
 class Graph:
     """a class for saving graph and give you graph data structure
@@ -29,10 +50,17 @@ class Graph:
             weight of an edge by default is 1, but you can change it like this: A = (1, 2, 3)
             now A edge connect vertex 1 to vertex 2 with weight 3
         """
-        self.V = v
+        self.V = v if isinstance(v, set) else set(v)
         self.E = e
         self.type = graph_type
-        self.p = len(v)
+        # vertices that only appear in edges belong to the graph too, they are added to
+        # the graph's own copy so the caller's set isn't changed
+        missing = {vertex for edge in e for vertex in edge[:2] if vertex not in self.V}
+        if missing:
+            if self.V is v:
+                self.V = set(v)
+            self.V.update(missing)
+        self.p = len(self.V)
         self.q = len(e)
 
         # check the graph type
@@ -46,8 +74,98 @@ class Graph:
         else:
             self.empty = False
 
-    def is_DAG(self):
+        # adjacency indexes, kept in sync with V and E by add_vertex and add_edge.
+        # vertices get dense ids so algorithms work on lists and only translate labels at the end
+        self._interner = VertexInterner()
+        self._adj = []  # id -> ids of out-neighbors
+        self._adj_w = []  # id -> weights of the edges in _adj
+        self._out_degree = []  # id -> out-degree
+        if self.type == "d":
+            self._radj = []  # id -> ids of in-neighbors
+            self._radj_w = []
+            self._in_degree = []
+        else:
+            # in an undirected graph in-neighbors and out-neighbors are the same
+            self._radj = self._adj
+            self._radj_w = self._adj_w
+            self._in_degree = self._out_degree
+        self._w = {}  # (start, end) -> weight
+        # connected components (weakly connected for "d"), merged as edges arrive
+        self._components = DisjointSet()
+        for vertex in self.V:
+            self._index_vertex(vertex)
+        for edge in e:
+            self._index_edge(edge)
+
+        # every change to V or E bumps the version, cached results are keyed by it
+        self.version = 0
+        self._cache = OrderedDict()  # (kind, source, version) -> result
+        self._cache_size = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        self._profiler = None  # a GraphProfiler while profiling, see profile
+
+    def _index_edge(self, edge: tuple):
+        """add an edge to the adjacency indexes
+
+        Args:
+            edge (tuple): the edge tuple in e set
+        """
+        start, end = edge[0], edge[1]
+        weight = edge[2] if len(edge) > 2 else 1
+        i = self._index_vertex(start)
+        j = self._index_vertex(end)
+
+        self._adj[i].append(j)
+        self._adj_w[i].append(weight)
+        self._out_degree[i] += 1
+        if self.type == "d":
+            self._radj[j].append(i)
+            self._radj_w[j].append(weight)
+            self._in_degree[j] += 1
+        else:
+            if i != j:
+                self._adj[j].append(i)
+                self._adj_w[j].append(weight)
+            self._out_degree[j] += 1
+        self._components.union(i, j)
+
+        # parallel edges keep the lightest weight
+        if (start, end) not in self._w or weight < self._w[(start, end)]:
+            self._w[(start, end)] = weight
+            if self.type == "ud":
+                self._w[(end, start)] = weight
+
+    def _index_vertex(self, vertex: int):
+        """give a vertex an id and empty adjacency lists if it doesn't have them yet
+
+        Args:
+            vertex (int): the vertex
+
+        Returns:
+            int: the id of the vertex
+        """
+        i = self._interner.add(vertex)
+        if i == len(self._adj):
+            self._adj.append([])
+            self._adj_w.append([])
+            self._out_degree.append(0)
+            self._components.add()
+            if self.type == "d":
+                self._radj.append([])
+                self._radj_w.append([])
+                self._in_degree.append(0)
+        return i
+
+    @profiled
+    def is_DAG(self, fast: bool = False):
         """check is graph directed acyclic graph or not
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            fast (bool): if True, stop at the first back edge of a DFS instead of finding all SCCs. Defaults to False.
 
         Returns:
             boolean: if output is true means the graph is directed acyclic and if it is false the graph isn't directed acyclic
@@ -55,15 +173,48 @@ class Graph:
         Description:
             when a graph is directed and doesn't have any cycles we call it a directed acyclic graph
         """
+        if self.type != "d":
+            return False
+        if fast:
+            return not self._has_back_edge()
 
-        # check graph has cycles or not
-        scc = self.cycles()
-        has_cycle = False
-        for c in scc:
-            if len(c) != 1:
-                has_cycle = True
-                break
-        return (self.type == "d") and not has_cycle
+        # a cycle is an SCC with more than one vertex or a vertex with a self-loop
+        for scc in self.cycles():
+            if len(scc) != 1 or (scc[0], scc[0]) in self._w:
+                return False
+        return True
+
+    def _has_back_edge(self):
+        """search the graph with an iterative DFS and stop at the first back edge
+
+        Returns:
+            boolean: True if the DFS found an edge to a vertex that is still on its path
+        """
+        adj = self._adj
+        profiler = self._profiler
+        state = bytearray(len(adj))  # 0 not seen, 1 on the DFS path, 2 done
+        for root in range(len(adj)):
+            if state[root]:
+                continue
+            state[root] = 1
+            if profiler is not None:
+                profiler.expand(len(adj[root]))
+            work = [(root, iter(adj[root]))]
+            while work:
+                vertex, neighbors = work[-1]
+                for n in neighbors:
+                    if state[n] == 1:
+                        return True
+                    if not state[n]:
+                        state[n] = 1
+                        if profiler is not None:
+                            profiler.expand(len(adj[n]))
+                        work.append((n, iter(adj[n])))
+                        break
+                else:
+                    work.pop()
+                    state[vertex] = 2
+        return False
 
     def out_deg(self, vertex: int):
         """return the out-degree of a vertex
@@ -74,18 +225,8 @@ class Graph:
         Returns:
             vertex degree: vertex degree is number of edges connected to a vertex
         """
-        d = 0
-        if self.type == "d":
-            for edge in self.E:
-                if (vertex in edge) and (edge.index(vertex) == 0):
-                    d += 1
-        else:
-            for edge in self.E:
-                if vertex in edge:
-                    d += 1
-                    if edge[0] == edge[1]:
-                        d += 1
-        return d
+        i = self._interner.ids.get(vertex)
+        return 0 if i is None else self._out_degree[i]
 
     def in_deg(self, vertex: int):
         """return the in-degree of a vertex
@@ -96,18 +237,8 @@ class Graph:
         Returns:
             vertex degree: vertex degree is number of edges connected to a vertex
         """
-        d = 0
-        if self.type == "d":
-            for edge in self.E:
-                if (vertex in edge) and (edge.index(vertex) == 1):
-                    d += 1
-        else:
-            for edge in self.E:
-                if vertex in edge:
-                    d += 1
-                    if edge[0] == edge[1]:
-                        d += 1
-        return d
+        i = self._interner.ids.get(vertex)
+        return 0 if i is None else self._in_degree[i]
 
     def neighboring_vertices(self, vertex: int):
         """return neighbors of a vertex
@@ -118,26 +249,11 @@ class Graph:
         Returns:
             list: a list of neighboring vertices of the vertex
         """
-        neighbors = []
-
-        # finding vertex neighbors of a directed graph
-        if self.type == "d":
-            for edge in self.E:
-                formatted_edge = (edge[0], edge[1])
-                if vertex in formatted_edge:
-                    i = formatted_edge.index(vertex)
-                    if i == 0:
-                        neighbors.append(edge[1])
-
-        # finding vertex neighbors of an undirected graph
-        elif self.type == "ud":
-            for edge in self.E:
-                formatted_edge = (edge[0], edge[1])
-                if vertex in formatted_edge:
-                    i = 1 - formatted_edge.index(vertex)
-                    neighbors.append(formatted_edge[i])
-
-        return neighbors
+        i = self._interner.ids.get(vertex)
+        if i is None:
+            return []
+        labels = self._interner.labels
+        return [labels[j] for j in self._adj[i]]
 
     def add_edge(self, edge: tuple):
         """add an edge to e set
@@ -149,13 +265,17 @@ class Graph:
             NameError: if the vertices wasn't in v this error will raise
         """
         is_valid = True
-        for v in edge:
+        for v in edge[:2]:
             if not(v in self.V):
                 is_valid = False
-        if is_valid:
-            self.E.add(edge)
-        else:
+        if not is_valid:
             raise NameError("Undefined vertex")
+        if edge not in self.E:
+            self.E.add(edge)
+            self._index_edge(edge)
+            self.q = len(self.E)
+            self.empty = False
+            self.version += 1
 
     def add_vertex(self, vertex: int):
         """add a new vertex to v set
@@ -163,22 +283,216 @@ class Graph:
         Args:
             vertex (int): new vertex
         """
-        self.V.add(vertex)
+        if vertex not in self.V:
+            self.V.add(vertex)
+            self._index_vertex(vertex)
+            self.p = len(self.V)
+            self.version += 1
+
+    def add_vertices(self, vertices):
+        """add many vertices to v set at once
+
+        Args:
+            vertices (iterable): the new vertices
+        """
+        changed = False
+        for vertex in vertices:
+            if vertex not in self.V:
+                self.V.add(vertex)
+                self._index_vertex(vertex)
+                changed = True
+        if changed:
+            self.p = len(self.V)
+            self.version += 1
+
+    def add_edges(self, edges):
+        """add many edges to e set at once. the whole batch is checked before any edge is added
+
+        Args:
+            edges (iterable): the new edges
+
+        Raises:
+            NameError: if a vertex of the batch wasn't in v this error will raise
+        """
+        edges = [edge for edge in edges if edge not in self.E]
+        endpoints = {edge[0] for edge in edges}
+        endpoints.update(edge[1] for edge in edges)
+        if not endpoints <= self.V:
+            raise NameError("Undefined vertex")
+        for edge in edges:
+            if edge not in self.E:  # the batch itself may repeat an edge
+                self.E.add(edge)
+                self._index_edge(edge)
+        if edges:
+            self.q = len(self.E)
+            self.empty = False
+            self.version += 1
+
+    def set_profiler(self, profiler: GraphProfiler = None):
+        """attach a profiler to the graph, algorithms record their calls and hot-path counters in it
+
+        Args:
+            profiler (GraphProfiler): the profiler, None turns profiling off. Defaults to None.
+        """
+        self._profiler = profiler
+
+    @contextmanager
+    def profile(self, callback=None):
+        """profile the algorithms called inside a with block
+
+        Args:
+            callback (callable): called after every algorithm call with (algorithm name, seconds, counters). Defaults to None.
+
+        Yields:
+            GraphProfiler: the profiler, read its report() for the numbers
+        """
+        previous = self._profiler
+        profiler = GraphProfiler(callback)
+        self._profiler = profiler
+        try:
+            yield profiler
+        finally:
+            self._profiler = previous
+
+    def set_cache_size(self, size: int):
+        """set how many per-source results (dijkstra trees and reachable sets) are cached
+
+        Args:
+            size (int): maximum number of cached results, 0 turns the cache off
+
+        Raises:
+            ValueError: if size is negative
+        """
+        if size < 0:
+            raise ValueError("cache size can't be negative")
+        self._cache_size = size
+        while len(self._cache) > size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """remove every cached result and reset the hit and miss counters
+        """
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def cache_info(self):
+        """give you the cache statistics
+
+        Returns:
+            dict: hits, misses, current size and maximum size of the cache
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+        }
 
+    def _cached(self, kind: str, source, compute):
+        """return a cached per-source result or compute and cache it (least recently used goes first)
+
+        Args:
+            kind (str): name of the cached result
+            source (any): the source vertex
+            compute (callable): makes the result when it isn't cached
+
+        Returns:
+            any: the result of compute for the current version of the graph
+        """
+        key = (kind, source, self.version)
+        cache = self._cache
+        if key in cache:
+            self._cache_hits += 1
+            cache.move_to_end(key)
+            return cache[key]
+        self._cache_misses += 1
+        result = compute()
+        cache[key] = result
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return result
+
+    @profiled
     def adjacency_list(self):
         """make adjacency list of the graph and return it
 
         Returns:
             dict: adjacency list of the graph
         """
-        adjacency_list = dict.fromkeys(self.V, None)
-        for vertex in self.V:
-            neighbors = self.neighboring_vertices(vertex)
-            adjacency_list[vertex] = neighbors
-        return adjacency_list
+        labels = self._interner.labels
+        return {labels[i]: [labels[j] for j in row] for i, row in enumerate(self._adj)}
+
+    @profiled
+    def freeze(self):
+        """pack the graph into a read-only CSRGraph.
+            vertices keep their dense ids and edges are stored in flat arrays
+            algorithm time complexity = O(V + E)
+
+        Returns:
+            CSRGraph: a compact copy of the graph with the same traversal API
+        """
+        offsets = array("q", [0])
+        total = 0
+        for row in self._adj:
+            total += len(row)
+            offsets.append(total)
+        targets = array("q", chain.from_iterable(self._adj))
+        weights = list(chain.from_iterable(self._adj_w))
+        if all(type(w) is int for w in weights):
+            weights = array("q", weights)
+        else:
+            weights = array("d", weights)
+        in_degrees = array("q", self._in_degree)
+        out_degrees = array("q", self._out_degree)
+        return CSRGraph(self._interner.labels, self.type, offsets, targets, weights, in_degrees, out_degrees)
+
+    def reversed(self):
+        """make a view of the graph with every edge flipped, nothing is copied
+            algorithm time complexity = O(1)
+
+        Returns:
+            GraphView: a read-only view that shares the adjacency lists of the graph
+        """
+        # imported here because pyGraphView needs this module
+        from pyGraphView import GraphView
+
+        return GraphView(self, reverse=True)
+
+    def subgraph(self, vertices):
+        """make a view of the subgraph induced by some vertices, edges aren't copied
+            algorithm time complexity = O(k * log(k)) for k vertices
+
+        Args:
+            vertices (iterable): vertices of the subgraph
+
+        Raises:
+            NameError: if a vertex wasn't in v this error will raise
+
+        Returns:
+            GraphView: a read-only view with these vertices and the edges between them
+        """
+        from pyGraphView import GraphView
+
+        return GraphView(self, vertices=vertices)
+
+    def edge_filter(self, predicate):
+        """make a view of the graph with only some of its edges, nothing is copied
+            algorithm time complexity = O(1), each edge is checked when an algorithm reaches it
+
+        Args:
+            predicate (callable): gets a (start, end, weight) tuple and returns True to keep the edge
+
+        Returns:
+            GraphView: a read-only view with every vertex and the kept edges
+        """
+        from pyGraphView import GraphView
+
+        return GraphView(self, edge_filter=predicate)
 
+    @profiled
     def has_path(self, start: int, target: int):
-        """check there is a path between start and target vertex using DFS.
+        """check there is a path between start and target vertex using a bidirectional BFS.
             algorithm time complexity = O(V + E)
             algorithm space complexity = O(V)
 
@@ -188,78 +502,478 @@ class Graph:
 
         Returns:
             boolean: a boolean value to show there is a path or not
+
+        Description:
+            in an undirected graph this is a near O(1) union-find lookup, see connected.
+            when the cache is on (see set_cache_size) the whole reachable set of start is
+            computed once and reused until the graph changes.
+            a vertex that isn't in the graph only has a path to itself
         """
-        looked = []
-        stack = Stack()
-        stack.put(start)
-        target_found = False
-        while not target_found:
-            if stack.length == 0:
-                break
-            vertex = stack.get()
-            if not(vertex in looked):
-                if vertex == target:
-                    target_found = True
-                else:
-                    looked.append(vertex)
-                    for v in self.neighboring_vertices(vertex):
-                        stack.put(v)
-        return target_found
+        ids = self._interner.ids
+        source = ids.get(start)
+        goal = ids.get(target)
+        if source is None or goal is None:
+            return start == target
+        if self.type == "ud":
+            return self._components.connected(source, goal)
+        if self._cache_size:
+            return target in self._cached("reach", start, lambda: self._reachable(start))
+        if source == goal:
+            return True
+        # search forward from start and backward from target until they meet
+        forward = self._bfs_ids(source)
+        backward = self._bfs_ids(goal, reverse=True)
+        seen_forward = bytearray(len(ids))
+        seen_backward = bytearray(len(ids))
+        while True:
+            vertex = next(forward, _END)
+            if vertex is _END:
+                return False
+            if seen_backward[vertex]:
+                return True
+            seen_forward[vertex] = 1
+
+            vertex = next(backward, _END)
+            if vertex is _END:
+                return False
+            if seen_forward[vertex]:
+                return True
+            seen_backward[vertex] = 1
+
+    def _reachable(self, start: int):
+        """find every vertex reachable from start
+
+        Args:
+            start (int): starting vertex
+
+        Returns:
+            set: the reachable vertices, start included
+        """
+        labels = self._interner.labels
+        return {labels[i] for i in self._bfs_ids(self._interner.ids[start])}
+
+    def connected(self, start: int, target: int):
+        """check two vertices are in the same connected component
+            algorithm time complexity = O(α(V)) amortized
+
+        Args:
+            start (int): a vertex
+            target (int): another vertex
+
+        Returns:
+            boolean: True if they are connected
+
+        Description:
+            components are kept up to date by add_edge and add_vertex. in a directed graph
+            they are the weakly connected components, edges are followed in both directions.
+            a vertex that isn't in the graph is only connected to itself
+        """
+        ids = self._interner.ids
+        source = ids.get(start)
+        goal = ids.get(target)
+        if source is None or goal is None:
+            return start == target
+        return self._components.connected(source, goal)
+
+    def component_of(self, vertex: int):
+        """return the representative vertex of the component of a vertex
+            algorithm time complexity = O(α(V)) amortized
+
+        Args:
+            vertex (int): the vertex
+
+        Returns:
+            any: a vertex of the component, the same one for every vertex of it until edges are added,
+                a vertex that isn't in the graph is only connected to itself (like connected) and is returned
+        """
+        i = self._interner.ids.get(vertex)
+        if i is None:
+            return vertex
+        return self._interner.labels[self._components.find(i)]
+
+    def component_size(self, vertex: int):
+        """return the number of vertices in the component of a vertex
+            algorithm time complexity = O(α(V)) amortized
+
+        Args:
+            vertex (int): the vertex
+
+        Returns:
+            int: the size of the component, 1 for a vertex that isn't in the graph (see component_of)
+        """
+        i = self._interner.ids.get(vertex)
+        if i is None:
+            return 1
+        return self._components.set_size(i)
+
+    def num_components(self):
+        """return the number of connected components
+            algorithm time complexity = O(1)
+
+        Returns:
+            int: number of components
+        """
+        return self._components.count
+
+    def component_sizes(self):
+        """return the size of every connected component
+            algorithm time complexity = O(V)
+
+        Returns:
+            dict: representative vertex (see component_of) -> size of its component
+        """
+        components = self._components
+        labels = self._interner.labels
+        return {labels[i]: components.size[i] for i in range(len(labels)) if components.find(i) == i}
 
-    def dijkstra(self, start: int):
+    @profiled
+    def connected_components(self):
+        """find every connected component with BFS
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Returns:
+            list: a list of components, each one a list of vertices in BFS order
+        """
+        adj = self._adj
+        radj = self._radj
+        directed = self.type == "d"
+        labels = self._interner.labels
+        profiler = self._profiler
+        visited = bytearray(len(adj))
+        components = []
+        for root in range(len(adj)):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            queue = [root]
+            i = 0
+            while i < len(queue):
+                v = queue[i]
+                i += 1
+                for n in chain(adj[v], radj[v]) if directed else adj[v]:
+                    if not visited[n]:
+                        visited[n] = 1
+                        queue.append(n)
+                if profiler is not None:
+                    profiler.expand(len(adj[v]) + len(radj[v]) if directed else len(adj[v]))
+            components.append([labels[v] for v in queue])
+        return components
+
+    def _bfs_ids(self, source: int, reverse: bool = False):
+        """explore the graph lazily with BFS on dense ids
+
+        Args:
+            source (int): id of the start vertex
+            reverse (bool): follow the edges backward. Defaults to False.
+
+        Yields:
+            int: ids in BFS visiting order
+        """
+        adjacency = self._radj if reverse else self._adj
+        profiler = self._profiler
+        visited = bytearray(len(adjacency))
+        visited[source] = 1
+        # the visited ids are also the queue, i points to its head
+        queue = [source]
+        i = 0
+        while i < len(queue):
+            v = queue[i]
+            i += 1
+            yield v
+            queued = len(queue)
+            for n in adjacency[v]:
+                if not visited[n]:
+                    visited[n] = 1
+                    queue.append(n)
+            if profiler is not None:
+                profiler.count("queue_pops")
+                profiler.count("queue_pushes", len(queue) - queued)
+                profiler.expand(len(adjacency[v]))
+
+    def _search(self, source: int, goal: int = -1, heuristic=None):
+        """run a heap based dijkstra (or A* when heuristic is given) on dense ids
+
+        Args:
+            source (int): id of the source vertex
+            goal (int): stop as soon as this id is settled. Defaults to -1.
+            heuristic (callable): heuristic(vertex, target) estimate of the remaining distance,
+                called with labels. Defaults to None.
+
+        Returns:
+            tuple: (dist, prev) lists indexed by id, prev is -1 for the source and unreached vertices
+        """
+        inf = float("inf")
+        dist = [inf] * len(self._adj)
+        prev = [-1] * len(self._adj)
+        for _ in self._iter_search(source, dist, prev, goal, heuristic):
+            pass
+        return dist, prev
+
+    def _iter_search(self, source: int, dist: list, prev: list, goal: int = -1, heuristic=None):
+        """run _search lazily, dist and prev are filled in as the search goes
+
+        Args:
+            source (int): id of the source vertex
+            dist (list): id -> distance, all inf at the beginning
+            prev (list): id -> id of the previous vertex on the shortest path, all -1 at the beginning
+            goal (int): stop as soon as this id is settled. Defaults to -1.
+            heuristic (callable): see _search. Defaults to None.
+
+        Yields:
+            int: ids of the settled vertices, in the order they are settled
+        """
+        adj = self._adj
+        adj_w = self._adj_w
+        profiler = self._profiler
+        dist[source] = 0
+        if heuristic is not None:
+            labels = self._interner.labels
+            target = labels[goal]
+        # entries are (priority, distance, id)
+        heap = [(0, 0, source)]
+        if profiler is not None:
+            profiler.count("queue_pushes")
+        while heap:
+            _, d, v = heappop(heap)
+            if profiler is not None:
+                profiler.count("queue_pops")
+            if d > dist[v]:
+                continue  # a stale entry, v was reached cheaper later
+            yield v
+            if v == goal:
+                break
+            if profiler is not None:
+                profiler.expand(len(adj[v]))
+            for n, weight in zip(adj[v], adj_w[v]):
+                new_dist = d + weight
+                if new_dist < dist[n]:
+                    dist[n] = new_dist
+                    prev[n] = v
+                    priority = new_dist
+                    if heuristic is not None:
+                        priority += heuristic(labels[n], target)
+                    heappush(heap, (priority, new_dist, n))
+                    if profiler is not None:
+                        profiler.count("relaxations")
+                        profiler.count("queue_pushes")
+
+    @profiled
+    def dijkstra(self, start: int, target: int = None):
         """A SSSP dijkstra to find the shortest path
-            algorithm time complexity = O(V ^ 2)
+            algorithm time complexity = O((V + E) * log(V))
             algorithm space complexity = O(V)
             WARNING : This algorithm won't work for negative edge weight
 
 
         Args:
             start (int): the source vertex
+            target (int): if given, the search stops as soon as target is settled. Defaults to None.
 
         Returns:
             dict: the distance dict in dijkstra algorithm
+
+        Description:
+            with a target only the target (and the vertices on its path) are guaranteed to have
+            their final distance, other vertices may keep a temporary one.
+            when the cache is on (see set_cache_size) the full tree is computed once and the same
+            dict is returned until the graph changes, so don't modify it
         """
-        data = {v: {"dist": float("inf"), "prev": None} for v in self.V}
-        data[start]["dist"] = 0
-        pq = {start: 0}
-        visited = []
-        while True:
-            if len(pq) == 0:
-                return data
-            min_ = float("inf")
-            vertex = None
-            for v in pq:
-                if pq[v] < min_:
-                    min_ = pq[v]
-                    vertex = v
-            pq.pop(vertex)
-            visited.append(vertex)
-            for n in self.neighboring_vertices(vertex):
-                if not(n in visited):
-                    new_dist = self.weight((vertex, n)) + data[vertex]["dist"]
-                    if new_dist < data[n]["dist"]:
-                        data[n]["dist"] = new_dist
-                        pq[n] = new_dist
-                        data[n]["prev"] = vertex
-
-    def shortest_path(self, start: int, target: int):
-        """finding the shortest path between to vertex with dijkstra method
+        if self._cache_size:
+            return self._cached("dijkstra", start, lambda: self._dijkstra_data(start))
+        return self._dijkstra_data(start, target)
+
+    def _dijkstra_data(self, start: int, target: int = None):
+        """run dijkstra and put the result in the dijkstra dict format
+
+        Args:
+            start (int): the source vertex
+            target (int): stop as soon as target is settled. Defaults to None.
+
+        Returns:
+            dict: the distance dict in dijkstra algorithm
+        """
+        ids = self._interner.ids
+        dist, prev = self._search(ids[start], -1 if target is None else ids[target])
+        return self._dijkstra_dict(dist, prev)
+
+    def _dijkstra_dict(self, dist: list, prev: list):
+        """put the lists of _search in the dijkstra dict format
+
+        Args:
+            dist (list): id -> distance
+            prev (list): id -> id of the previous vertex, -1 for none
+
+        Returns:
+            dict: the distance dict in dijkstra algorithm
+        """
+        labels = self._interner.labels
+        return {
+            labels[i]: {"dist": dist[i], "prev": None if prev[i] == -1 else labels[prev[i]]}
+            for i in range(len(labels))
+        }
+
+    def multi_source_dijkstra(self, sources, workers: int = None, chunk_size: int = None):
+        """run dijkstra from many sources on a pool of processes, see pyParallel.multi_source_dijkstra
+
+        Args:
+            sources (iterable): the source vertices
+            workers (int): number of processes, 1 runs in this process. Defaults to the number of CPUs.
+            chunk_size (int): sources in one task. Defaults to about 4 tasks per worker.
+
+        Returns:
+            iterator: (source, distances) tuples in the order of sources, distances is a dict of the
+                reachable vertices and their distance from source
+        """
+        return multi_source_dijkstra(self, sources, workers, chunk_size)
+
+    def all_pairs_shortest_paths(self, workers: int = None, chunk_size: int = None):
+        """find the distance between every pair of vertices on a pool of processes
+
+        Args:
+            workers (int): number of processes, 1 runs in this process. Defaults to the number of CPUs.
+            chunk_size (int): sources in one task. Defaults to about 4 tasks per worker.
+
+        Returns:
+            iterator: (source, distances) tuples for every vertex
+        """
+        return all_pairs_shortest_paths(self, workers, chunk_size)
+
+    @profiled
+    def shortest_path(self, start: int, target: int, heuristic=None):
+        """finding the shortest path between to vertex with dijkstra method.
+            the search stops as soon as the target is reached
 
         Args:
             start (int): the source vertex
             target (int): the end vertex
+            heuristic (callable): if given, A* is used instead of dijkstra. heuristic(vertex, target)
+                should return an estimate of the distance between vertex and target that never
+                overestimates it. Defaults to None.
 
         Returns:
-            list: a list that has the shortest path
+            list: a list that has the shortest path, empty if target isn't reachable from start
         """
-        path = [target]
-        result = self.dijkstra(start)
-        vertex = result[target]["prev"]
-        while vertex is not None:
-            path.insert(0, vertex)
-            vertex = result[vertex]["prev"]
+        if self._cache_size and heuristic is None:
+            data = self.dijkstra(start)
+            if data[target]["dist"] == float("inf"):
+                return []
+            path = []
+            vertex = target
+            while vertex is not None:
+                path.append(vertex)
+                vertex = data[vertex]["prev"]
+            path.reverse()
+            return path
+
+        ids = self._interner.ids
+        goal = ids[target]
+        dist, prev = self._search(ids[start], goal, heuristic)
+        if dist[goal] == float("inf"):
+            return []
+        labels = self._interner.labels
+        path = []
+        i = goal
+        while i != -1:
+            path.append(labels[i])
+            i = prev[i]
+        path.reverse()
         return path
 
+    def degrees(self):
+        """return the in-degree and out-degree of every vertex in one pass
+            algorithm time complexity = O(V)
+
+        Returns:
+            tuple: (vertices, in_degrees, out_degrees). vertices is a tuple and the degree arrays are
+                numpy arrays when numpy is installed, otherwise int64 arrays, both in vertices order
+        """
+        return tuple(self._interner.labels), self._degree_array("id"), self._degree_array("od")
+
+    def _degree_array(self, deg_type: str):
+        """make an array of one kind of degree, indexed by vertex id
+
+        Args:
+            deg_type (str): ID for in-degree and OD for out-degree
+
+        Raises:
+            ValueError: if deg_type is neither ID nor OD
+
+        Returns:
+            array: degrees of the vertices
+        """
+        if deg_type.lower() == "od":
+            counter = self._out_degree
+        elif deg_type.lower() == "id":
+            counter = self._in_degree
+        else:
+            raise ValueError("Unknown type of degree")
+        if np is not None:
+            return np.array(counter, dtype=np.int64)
+        return array("q", counter)
+
+    def argmax_degree(self, deg_type: str = "OD"):
+        """find the vertex with the biggest in-degree or out-degree
+
+        Args:
+            deg_type (str): ID for in-degree and OD for out-degree. Defaults to "OD".
+
+        Returns:
+            any: the vertex
+        """
+        return self.maximum(deg_type)["vertex"]
+
+    def argmin_degree(self, deg_type: str = "OD"):
+        """find the vertex with the smallest in-degree or out-degree
+
+        Args:
+            deg_type (str): ID for in-degree and OD for out-degree. Defaults to "OD".
+
+        Returns:
+            any: the vertex
+        """
+        return self.minimum(deg_type)["vertex"]
+
+    def top_k(self, k: int, deg_type: str = "OD"):
+        """find the k vertices with the biggest in-degree or out-degree
+            algorithm time complexity = O(V + k * log(k))
+
+        Args:
+            k (int): number of vertices you want
+            deg_type (str): ID for in-degree and OD for out-degree. Defaults to "OD".
+
+        Returns:
+            list: a list of (vertex, degree) tuples from the biggest degree to the smallest
+        """
+        vertices = self._interner.labels
+        degrees = self._degree_array(deg_type)
+        k = min(k, len(vertices))
+        if k <= 0:
+            return []
+        if np is not None:
+            best = np.argpartition(-degrees, k - 1)[:k]
+            best = best[np.argsort(-degrees[best], kind="stable")]
+            return [(vertices[i], int(degrees[i])) for i in best]
+        best = nlargest(k, range(len(vertices)), key=degrees.__getitem__)
+        return [(vertices[i], degrees[i]) for i in best]
+
+    def degree_histogram(self, deg_type: str = "OD"):
+        """count how many vertices have each in-degree or out-degree
+
+        Args:
+            deg_type (str): ID for in-degree and OD for out-degree. Defaults to "OD".
+
+        Returns:
+            list: item i is the number of vertices with degree i
+        """
+        degrees = self._degree_array(deg_type)
+        if np is not None:
+            return np.bincount(degrees).tolist()
+        histogram = [0] * (max(degrees, default=-1) + 1)
+        for d in degrees:
+            histogram[d] += 1
+        return histogram
+
     def maximum(self, deg_type: str = "OD"):
         """find the vertex with the biggest in-degree or out-degree
 
@@ -269,14 +983,13 @@ class Graph:
         Returns:
             dict: this dict includes vertex number in V set and its degree
         """
-        degrees = None
-        if deg_type.lower() == "od":
-            degrees = [self.out_deg(v) for v in self.V]
-        if deg_type.lower() == "id":
-            degrees = [self.in_deg(v) for v in self.V]
-        degree = max(degrees)
-        vertex = tuple(self.V)[degrees.index(degree)]
-        return {"vertex": vertex, "degree": degree}
+        vertices = self._interner.labels
+        degrees = self._degree_array(deg_type)
+        if np is not None:
+            i = int(np.argmax(degrees))
+        else:
+            i = max(range(len(vertices)), key=degrees.__getitem__)
+        return {"vertex": vertices[i], "degree": int(degrees[i])}
 
     def minimum(self, deg_type="OD"):
         """find the vertex with the smallest in-degree or out-degree
@@ -287,14 +1000,13 @@ class Graph:
         Returns:
             dict: this dict includes vertex number in V set and its degree
         """
-        degrees = None
-        if deg_type.lower() == "od":
-            degrees = [self.out_deg(v) for v in self.V]
-        if deg_type.lower() == "id":
-            degrees = [self.in_deg(v) for v in self.V]
-        degree = min(degrees)
-        vertex = tuple(self.V)[degrees.index(degree)]
-        return {"vertex": vertex, "degree": degree}
+        vertices = self._interner.labels
+        degrees = self._degree_array(deg_type)
+        if np is not None:
+            i = int(np.argmin(degrees))
+        else:
+            i = min(range(len(vertices)), key=degrees.__getitem__)
+        return {"vertex": vertices[i], "degree": int(degrees[i])}
 
     def weight(self, edge: tuple):
         """find the weight( or we can call it length) of an edge
@@ -305,50 +1017,207 @@ class Graph:
         Returns:
             int: return the weight of the edge
         """
-        for e in self.E:
-            formatted_edge = (e[0], e[1])
-            if formatted_edge == edge or formatted_edge == (edge[1], edge[0]):
-                try:
-                    return e[2]
-                except IndexError:
-                    return 1
-
-    def colorize(self):
+        weight = self._w.get((edge[0], edge[1]))
+        if weight is None:
+            weight = self._w.get((edge[1], edge[0]))
+        return weight
+
+    @profiled
+    def colorize(self, strategy: str = "greedy"):
         """colorize a graph. each vertex has different color with its neighbors.
-            this algorithm use minimum colors to colorize graph.
+            this algorithm tries to use minimum colors to colorize graph.
+            algorithm time complexity = O(V + E) for greedy, largest_first and smallest_last
+            and O((V + E) * log(V)) for dsatur
+
+        Args:
+            strategy (str): the order vertices are colored in. Defaults to "greedy".
+
+        Raises:
+            ValueError: if the strategy is unknown
 
         Returns:
             dict: a dict of vertices with their color
+
+        Description:
+            strategies include:
+                greedy : vertices in the order they were added, the fastest one
+                largest_first : vertices from the biggest degree to the smallest (Welsh-Powell)
+                smallest_last : repeatedly remove the vertex with the smallest degree and color in reverse
+                dsatur : always color the vertex with the most different neighbor colors, usually the fewest colors
+            colors are numbers starting from 0, each vertex gets the smallest color its neighbors don't have
         """
-        i = 0
-        colors = {i}
-        colored_vertices = dict.fromkeys(self.V, None)
-        for vertex in self.V:
-            neighbors_colors = set()
-            for n in self.neighboring_vertices(vertex):
-                color = colored_vertices[n]
-                if not(color is None):
-                    neighbors_colors.add(color)
-            new_color = colors - neighbors_colors
-            if new_color == set():
-                i += 1
-                colors.add(i)
-                colored_vertices[vertex] = i
-            else:
-                colored_vertices[vertex] = new_color.pop()
-        return colored_vertices
+        n = len(self._adj)
+        if strategy == "dsatur":
+            colors = self._dsatur()
+        elif strategy == "greedy":
+            colors = self._greedy_colors(range(n))
+        elif strategy == "largest_first":
+            colors = self._greedy_colors(sorted(range(n), key=self._color_degree, reverse=True))
+        elif strategy == "smallest_last":
+            colors = self._greedy_colors(self._smallest_last_order())
+        else:
+            raise ValueError(f"Unknown coloring strategy {strategy!r}, use one of {COLORING_STRATEGIES}")
+        return dict(zip(self._interner.labels, colors))
+
+    def colorize_report(self, strategy: str = "greedy"):
+        """colorize the graph and tell you how good and how fast it was
+
+        Args:
+            strategy (str): one of COLORING_STRATEGIES, see colorize. Defaults to "greedy".
+
+        Returns:
+            dict: colors (the colorize dict), count (number of colors), strategy and time (seconds)
+        """
+        started = perf_counter()
+        colors = self.colorize(strategy)
+        elapsed = perf_counter() - started
+        return {
+            "colors": colors,
+            "count": max(colors.values(), default=-1) + 1,
+            "strategy": strategy,
+            "time": elapsed,
+        }
+
+    def _color_neighbors(self, i: int):
+        """return the vertices that can't have the same color as vertex i
+
+        Args:
+            i (int): id of the vertex
+
+        Returns:
+            iterable: ids of out-neighbors, and in-neighbors too in a directed graph
+        """
+        if self.type == "d":
+            return chain(self._adj[i], self._radj[i])
+        return self._adj[i]
 
-    def minimum_colors(self):
+    def _color_degree(self, i: int):
+        """return the number of neighbors entries of a vertex for coloring
+
+        Args:
+            i (int): id of the vertex
+
+        Returns:
+            int: length of _color_neighbors(i)
+        """
+        if self.type == "d":
+            return len(self._adj[i]) + len(self._radj[i])
+        return len(self._adj[i])
+
+    def _greedy_colors(self, order):
+        """give each vertex the smallest color its colored neighbors don't have
+
+        Args:
+            order (iterable): ids of the vertices in coloring order
+
+        Returns:
+            list: the color of each vertex id
+        """
+        colors = [-1] * len(self._adj)
+        profiler = self._profiler
+        for i in order:
+            if profiler is not None:
+                profiler.expand(self._color_degree(i))
+            # bit c of mask is set when a neighbor has color c
+            mask = 0
+            for n in self._color_neighbors(i):
+                color = colors[n]
+                if color != -1:
+                    mask |= 1 << color
+            colors[i] = (~mask & (mask + 1)).bit_length() - 1
+        return colors
+
+    def _smallest_last_order(self):
+        """order the vertices by repeatedly removing one with the smallest remaining degree
+            algorithm time complexity = O(V + E)
+
+        Returns:
+            list: ids of the vertices, the last removed one first
+        """
+        degree = [self._color_degree(i) for i in range(len(self._adj))]
+        buckets = [set() for _ in range(max(degree, default=0) + 1)]
+        for i, d in enumerate(degree):
+            buckets[d].add(i)
+        removed = bytearray(len(degree))
+        order = []
+        smallest = 0
+        for _ in range(len(degree)):
+            while not buckets[smallest]:
+                smallest += 1
+            i = buckets[smallest].pop()
+            removed[i] = 1
+            order.append(i)
+            for n in self._color_neighbors(i):
+                if not removed[n]:
+                    buckets[degree[n]].discard(n)
+                    degree[n] -= 1
+                    buckets[degree[n]].add(n)
+                    if degree[n] < smallest:
+                        smallest = degree[n]
+        order.reverse()
+        return order
+
+    def _dsatur(self):
+        """colorize with DSATUR, vertices wait in one heap per saturation (number of different neighbor colors)
+            algorithm time complexity = O((V + E) * log(V))
+
+        Returns:
+            list: the color of each vertex id
+        """
+        n = len(self._adj)
+        colors = [-1] * n
+        profiler = self._profiler
+        neighbor_colors = [0] * n  # bitmask of the colors around each vertex
+        saturation = [0] * n
+        # ties are broken by the biggest degree, found once since a view filters a row to find it
+        degree = [self._color_degree(i) for i in range(n)]
+        first = [(-d, i) for i, d in enumerate(degree)]
+        heapify(first)
+        if profiler is not None:
+            profiler.count("queue_pushes", len(first))
+        buckets = [first]
+        top = 0
+        while top >= 0:
+            bucket = buckets[top]
+            if not bucket:
+                top -= 1
+                continue
+            i = heappop(bucket)[1]
+            if profiler is not None:
+                profiler.count("queue_pops")
+            if colors[i] != -1 or saturation[i] != top:
+                continue  # a stale entry, the vertex moved to a higher bucket
+            if profiler is not None:
+                profiler.expand(degree[i])
+            mask = neighbor_colors[i]
+            color = (~mask & (mask + 1)).bit_length() - 1
+            colors[i] = color
+            bit = 1 << color
+            for j in self._color_neighbors(i):
+                if colors[j] != -1 or neighbor_colors[j] & bit:
+                    continue
+                neighbor_colors[j] |= bit
+                saturation[j] += 1
+                level = saturation[j]
+                if level == len(buckets):
+                    buckets.append([])
+                heappush(buckets[level], (-degree[j], j))
+                if profiler is not None:
+                    profiler.count("queue_pushes")
+                if level > top:
+                    top = level
+        return colors
+
+    def minimum_colors(self, strategy: str = "greedy"):
         """use colorize method to find minimum colors needed for colorize the graph
 
+        Args:
+            strategy (str): one of COLORING_STRATEGIES, see colorize. Defaults to "greedy".
+
         Returns:
             int: number of minimum colors needed for colorize the graph
         """
-        colored_graph = self.colorize()
-        colors = set()
-        for key in colored_graph:
-            colors.add(colored_graph[key])
-        return len(colors)
+        return self.colorize_report(strategy)["count"]
 
     def reverse_edges(self):
         """revese the direction of edges
@@ -362,33 +1231,70 @@ class Graph:
             reversed_edges.add(reversed_edge)
         return reversed_edges
 
+    @profiled
     def cycles(self):
-        """find the SCC (Strongly Connected Components) of the graph with kosaraju's algorithm
+        """find the SCC (Strongly Connected Components) of the graph with an iterative tarjan's algorithm
             algorithm time complexity = O(V + E)
             algorithm space complexity = O(V)
 
         Returns:
-            list: a 2D list of SCC
+            list: a 2D list of SCC, in topological order of the components
         """
-        checked = []
-        start = self.maximum()["vertex"]
-        order_stack = self.dfs(start)
-        print("checked = ", checked)
-        self.E = self.reverse_edges()
+        adj = self._adj
+        profiler = self._profiler
+        n = len(adj)
+        index = [-1] * n  # id -> DFS discovery number
+        low = [0] * n  # id -> smallest discovery number reachable from its DFS subtree
+        on_stack = bytearray(n)
+        stack = []
         sccs = []
-        for i in range(order_stack.length):
-            vetrex = order_stack.pop()
-            if not(vetrex in checked):
-                scc = self.dfs(vetrex, checked, Stack())
-                scc_list = []
-                order_stack.show()
-                for j in range(scc.length):
-                    scc_list.append(scc.pop())
-                sccs.append(scc_list)
-        self.E = self.reverse_edges()
-        return sccs
-
-    def dfs(self, vertex: int, explored=[], order=Stack()):
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            if profiler is not None:
+                profiler.expand(len(adj[root]))
+            work = [(root, iter(adj[root]))]
+            while work:
+                vertex, neighbors = work[-1]
+                for t in neighbors:
+                    if index[t] == -1:
+                        index[t] = low[t] = counter
+                        counter += 1
+                        stack.append(t)
+                        on_stack[t] = 1
+                        if profiler is not None:
+                            profiler.expand(len(adj[t]))
+                        work.append((t, iter(adj[t])))
+                        break
+                    if on_stack[t] and index[t] < low[vertex]:
+                        low[vertex] = index[t]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[vertex] < low[parent]:
+                            low[parent] = low[vertex]
+                    if low[vertex] == index[vertex]:
+                        scc = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            scc.append(member)
+                            if member == vertex:
+                                break
+                        sccs.append(scc)
+        # tarjan finds the components in reverse topological order
+        sccs.reverse()
+        labels = self._interner.labels
+        return [[labels[i] for i in scc] for scc in sccs]
+
+    @profiled
+    def dfs(self, vertex: int, explored: set = None, order: Stack = None):
         """explore the graph and return the order of visiting with DFS.
             algorithm time complexity = O(V + E)
             algorithm space complexity = O(V)
@@ -396,20 +1302,50 @@ class Graph:
 
         Args:
             vertex (int): the start vertex of exploring
-            explored (list): a list for saving explored vertices. Defaults to [].
-            order (Stack): order of exploring vertices. Defaults to Stack().
+            explored (set): a set for saving explored vertices, it is updated in place. Defaults to a new set.
+            order (Stack): order of exploring vertices. Defaults to a new Stack.
 
         Returns:
-            Stack: a stack of DFS visiting order
+            Stack: a stack of DFS finishing order, the start vertex is on top
         """
-        explored.append(vertex)
-        print(vertex, explored, sep="\n")
-        for n in self.neighboring_vertices(vertex):
-            if not(n in explored):
-                self.dfs(n, explored, order)
-        order.push(vertex)
+        if explored is None:
+            explored = set()
+        if order is None:
+            order = Stack()
+        adj = self._adj
+        ids = self._interner.ids
+        labels = self._interner.labels
+        profiler = self._profiler
+        seen = bytearray(len(adj))
+        for label in explored:
+            i = ids.get(label)
+            if i is not None:
+                seen[i] = 1
+        source = ids[vertex]
+        seen[source] = 1
+        found = [source]
+        if profiler is not None:
+            profiler.expand(len(adj[source]))
+        work = [(source, iter(adj[source]))]
+        while work:
+            v, neighbors = work[-1]
+            for n in neighbors:
+                if not seen[n]:
+                    seen[n] = 1
+                    found.append(n)
+                    if profiler is not None:
+                        profiler.expand(len(adj[n]))
+                    work.append((n, iter(adj[n])))
+                    break
+            else:
+                work.pop()
+                order.push(labels[v])
+                if profiler is not None:
+                    profiler.count("queue_pushes")
+        explored.update(labels[i] for i in found)
         return order
 
+    @profiled
     def bfs(self, vertex: int):
         """explore the graph and return the order of visiting with BFS
             algorithm time complexity = O(V + E)
@@ -421,19 +1357,113 @@ class Graph:
         Returns:
             list: a list of BFS visiting order
         """
-        bfs_order = []
-        q = Queue()
-        q.put(vertex)
+        return list(self.iter_bfs(vertex))
+
+    def level_bfs(self, sources, max_depth: int = None, callback=None):
+        """explore the graph with BFS one whole level at a time, see CSRGraph.level_bfs
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V + E)
+
+        Args:
+            sources (iterable): start vertices, all of them have depth 0
+            max_depth (int): don't go further than this many edges from the sources. Defaults to None.
+            callback (callable): called as callback(depth, frontier ids) before each level. Defaults to None.
+
+        Returns:
+            tuple: (vertices, dist, parent) arrays indexed by vertex id
+
+        Description:
+            the graph is frozen for every call, to run it many times freeze the graph once and call
+            level_bfs of the CSRGraph
+        """
+        return self.freeze().level_bfs(sources, max_depth, callback)
+
+    def iter_bfs(self, vertex: int, with_depth: bool = False, max_depth: int = None, reverse: bool = False):
+        """explore the graph lazily with BFS, you can stop whenever you want
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            vertex (int): start vertex
+            with_depth (bool): yield (vertex, depth, parent) tuples instead of vertices. Defaults to False.
+            max_depth (int): don't go further than this many edges from the start vertex. Defaults to None.
+            reverse (bool): follow the edges backward. Defaults to False.
+
+        Yields:
+            any: vertices in BFS visiting order, the start vertex has depth 0 and parent None
+        """
+        adjacency = self._radj if reverse else self._adj
+        labels = self._interner.labels
+        profiler = self._profiler
+        source = self._interner.ids[vertex]
+        visited = bytearray(len(adjacency))
+        visited[source] = 1
+        # the visited entries are also the queue, i points to its head
+        queue = [(source, 0, -1)]
+        if profiler is not None:
+            profiler.count("queue_pushes")
+        i = 0
+        while i < len(queue):
+            v, depth, parent = queue[i]
+            i += 1
+            if with_depth:
+                yield labels[v], depth, None if parent == -1 else labels[parent]
+            else:
+                yield labels[v]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            queued = len(queue)
+            for n in adjacency[v]:
+                if not visited[n]:
+                    visited[n] = 1
+                    queue.append((n, depth + 1, v))
+            if profiler is not None:
+                profiler.count("queue_pops")
+                profiler.count("queue_pushes", len(queue) - queued)
+                profiler.expand(len(adjacency[v]))
+
+    def iter_dfs(self, vertex: int, with_depth: bool = False, max_depth: int = None, reverse: bool = False):
+        """explore the graph lazily with DFS, you can stop whenever you want
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Args:
+            vertex (int): start vertex
+            with_depth (bool): yield (vertex, depth, parent) tuples instead of vertices. Defaults to False.
+            max_depth (int): don't go further than this many edges from the start vertex. Defaults to None.
+            reverse (bool): follow the edges backward. Defaults to False.
 
-        while not q.is_empty():
-            vertex = q.get()
-            # check is vertex visited or not for don't visit visited vertices
-            if not(vertex in bfs_order):
-                bfs_order.append(vertex)
-                for n in self.neighboring_vertices(vertex):
-                    q.put(n)
-        return bfs_order
+        Yields:
+            any: vertices in DFS discovery order, the start vertex has depth 0 and parent None
+        """
+        adjacency = self._radj if reverse else self._adj
+        labels = self._interner.labels
+        profiler = self._profiler
+        source = self._interner.ids[vertex]
+        visited = bytearray(len(adjacency))
+        visited[source] = 1
+        yield (vertex, 0, None) if with_depth else vertex
+        if profiler is not None:
+            profiler.expand(len(adjacency[source]))
+        work = [(source, iter(adjacency[source]))]
+        while work:
+            v, neighbors = work[-1]
+            depth = len(work)
+            if max_depth is not None and depth > max_depth:
+                work.pop()
+                continue
+            for n in neighbors:
+                if not visited[n]:
+                    visited[n] = 1
+                    yield (labels[n], depth, labels[v]) if with_depth else labels[n]
+                    if profiler is not None:
+                        profiler.expand(len(adjacency[n]))
+                    work.append((n, iter(adjacency[n])))
+                    break
+            else:
+                work.pop()
 
+    @profiled
     def topsort(self):
         """find the topological order of the graph with Kahn's algorithms
             algorithm time complexity = O(V + E)
@@ -445,18 +1475,188 @@ class Graph:
         Returns:
             list: a list of the graph's topological order
         """
-        if not self.is_DAG():
+        return list(self.iter_topsort())
+
+    def iter_topsort(self):
+        """give the topological order of the graph lazily with Kahn's algorithms
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Raises:
+            TypeError: none directed acyclic graphs don't have topological order, for a graph with
+                a cycle it is raised after the vertices before the cycle are given
+
+        Yields:
+            any: vertices in topological order
+        """
+        if self.type != "d":
+            raise TypeError("your graph isn't directed acyclic graph")
+        adj = self._adj
+        labels = self._interner.labels
+        in_degrees = list(self._in_degree)
+        # the ordered vertices are also the queue, i points to its head
+        profiler = self._profiler
+        queue = [v for v in range(len(adj)) if in_degrees[v] == 0]
+        i = 0
+        while i < len(queue):
+            v = queue[i]
+            i += 1
+            yield labels[v]
+            for n in adj[v]:
+                in_degrees[n] -= 1
+                if in_degrees[n] == 0:
+                    queue.append(n)
+            if profiler is not None:
+                profiler.count("queue_pops")
+                profiler.expand(len(adj[v]))
+        if profiler is not None:
+            profiler.count("queue_pushes", len(queue))
+        # vertices on a cycle never get to in-degree 0
+        if len(queue) != len(in_degrees):
+            raise TypeError("your graph isn't directed acyclic graph")
+
+    @profiled
+    def topo_levels(self):
+        """group the vertices in levels, vertices of a level only depend on vertices of earlier levels
+            so each level can be processed in parallel
+            algorithm time complexity = O(V + E)
+            algorithm space complexity = O(V)
+
+        Raises:
+            TypeError: none directed acyclic graphs don't have topological order
+
+        Returns:
+            list: a 2D list of levels, the first level has the vertices with in-degree 0
+        """
+        if self.type != "d":
+            raise TypeError("your graph isn't directed acyclic graph")
+        adj = self._adj
+        labels = self._interner.labels
+        in_degrees = list(self._in_degree)
+        levels = []
+        level = [v for v in range(len(adj)) if in_degrees[v] == 0]
+        ordered = 0
+        profiler = self._profiler
+        while level:
+            levels.append([labels[v] for v in level])
+            ordered += len(level)
+            next_level = []
+            for v in level:
+                for n in adj[v]:
+                    in_degrees[n] -= 1
+                    if in_degrees[n] == 0:
+                        next_level.append(n)
+                if profiler is not None:
+                    profiler.expand(len(adj[v]))
+            level = next_level
+        if ordered != len(in_degrees):
             raise TypeError("your graph isn't directed acyclic graph")
+        return levels
+
+    def _unchanged_guard(self):
+        """make a check for the async algorithms, other tasks may change the graph while they pause
+
+        Returns:
+            callable: raises RuntimeError if the graph was changed since this method was called
+        """
+        version = self.version
+
+        def guard():
+            if self.version != version:
+                raise RuntimeError("graph changed during traversal")
+
+        return guard
+
+    async def abfs(self, vertex: int, step: int = 1000, timeout: float = None):
+        """bfs for asyncio code, the event loop runs other tasks every step visited vertices
+
+        Args:
+            vertex (int): start vertex
+            step (int): vertices visited between pauses. Defaults to 1000.
+            timeout (float): seconds the search may take. Defaults to None.
+
+        Raises:
+            TimeoutError: if the search takes longer than timeout
+            RuntimeError: if the graph was changed by another task during a pause
+
+        Returns:
+            list: a list of BFS visiting order
+        """
         order = []
-        queue = Queue()
-        in_degrees = {v: self.in_deg(v) for v in self.V}
-        for vertex in in_degrees:
-            if in_degrees[vertex] == 0:
-                queue.put(vertex)
-
-        while not queue.is_empty():
-            element = queue.get()
-            order.append(element)
-            for n in self.neighboring_vertices(element):
-                in_degrees[n] = in_degrees[n] - 1
-            del in_degrees[element]
+        async for chunk in cooperate(self.iter_bfs(vertex), step, timeout, self._unchanged_guard()):
+            order.extend(chunk)
+        return order
+
+    async def adijkstra(self, start: int, target: int = None, step: int = 1000, timeout: float = None):
+        """dijkstra for asyncio code, the event loop runs other tasks every step settled vertices
+
+        Args:
+            start (int): the source vertex
+            target (int): if given, the search stops as soon as target is settled. Defaults to None.
+            step (int): vertices settled between pauses. Defaults to 1000.
+            timeout (float): seconds the search may take. Defaults to None.
+
+        Raises:
+            TimeoutError: if the search takes longer than timeout
+            RuntimeError: if the graph was changed by another task during a pause
+
+        Returns:
+            dict: the distance dict in dijkstra algorithm, see dijkstra
+        """
+        ids = self._interner.ids
+        source = ids[start]
+        goal = -1 if target is None else ids[target]
+        inf = float("inf")
+        dist = [inf] * len(self._adj)
+        prev = [-1] * len(self._adj)
+        async for _ in cooperate(self._iter_search(source, dist, prev, goal), step, timeout, self._unchanged_guard()):
+            pass
+        return self._dijkstra_dict(dist, prev)
+
+    async def ahas_path(self, start: int, target: int, step: int = 1000, timeout: float = None):
+        """has_path for asyncio code, the event loop runs other tasks every step visited vertices
+
+        Args:
+            start (int): starting vertex
+            target (int): ending vertex
+            step (int): vertices visited between pauses. Defaults to 1000.
+            timeout (float): seconds the search may take. Defaults to None.
+
+        Raises:
+            TimeoutError: if the search takes longer than timeout
+            RuntimeError: if the graph was changed by another task during a pause
+
+        Returns:
+            boolean: a boolean value to show there is a path or not
+        """
+        ids = self._interner.ids
+        source = ids.get(start)
+        goal = ids.get(target)
+        if source is None or goal is None:
+            return start == target
+        if self.type == "ud":
+            return self._components.connected(source, goal)
+        async for chunk in cooperate(self._bfs_ids(source), step, timeout, self._unchanged_guard()):
+            if goal in chunk:
+                return True
+        return False
+
+    async def atopsort(self, step: int = 1000, timeout: float = None):
+        """topsort for asyncio code, the event loop runs other tasks every step ordered vertices
+
+        Args:
+            step (int): vertices ordered between pauses. Defaults to 1000.
+            timeout (float): seconds the sort may take. Defaults to None.
+
+        Raises:
+            TypeError: none directed acyclic graphs don't have topological order
+            TimeoutError: if the sort takes longer than timeout
+            RuntimeError: if the graph was changed by another task during a pause
+
+        Returns:
+            list: a list of the graph's topological order
+        """
+        order = []
+        async for chunk in cooperate(self.iter_topsort(), step, timeout, self._unchanged_guard()):
+            order.extend(chunk)
+        return order
@@ -0,0 +1,265 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from pyGraph import Graph
+from pyCSRGraph import CSRGraph
+
+
+MAGIC = b"PYSGRAPH"
+FORMAT_VERSION = 1
+
+# magic, format version, flags, vertices count, row entries count, labels size in bytes
+_HEADER = struct.Struct("<8sIIQQQ")
+_DIRECTED = 1
+_FLOAT_WEIGHTS = 2
+_BIG_ENDIAN = 4
+
+
+def _number(text: str):
+    """convert a weight column to int or float
+
+    Args:
+        text (str): the weight text
+
+    Returns:
+        int: the weight, a float if it isn't an integer
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _parse_lines(lines, delimiter, vertex_type):
+    """turn edge list lines into edge tuples
+
+    Args:
+        lines (iterable): lines of "start end" or "start end weight"
+        delimiter (str): column separator, None means any whitespace
+        vertex_type (callable): converts a vertex column to a vertex
+
+    Raises:
+        ValueError: if a line doesn't have 2 or 3 columns
+
+    Yields:
+        tuple: an edge tuple
+    """
+    if delimiter is None:
+        rows = (line.split() for line in lines)
+    else:
+        rows = csv.reader(lines, delimiter=delimiter)
+    for number, row in enumerate(rows, 1):
+        if not row or row[0].lstrip().startswith("#"):
+            continue  # blank lines and comments
+        if len(row) == 2:
+            yield (vertex_type(row[0].strip()), vertex_type(row[1].strip()))
+        elif len(row) == 3:
+            yield (vertex_type(row[0].strip()), vertex_type(row[1].strip()), _number(row[2].strip()))
+        else:
+            raise ValueError(f"line {number} of the edge list should have 2 or 3 columns")
+
+
+def read_edges(source, delimiter: str = None, vertex_type=str, chunk_size: int = 100000):
+    """read an edge list in chunks
+
+    Args:
+        source (str | iterable): a file path, an iterable of text lines or an iterable of edge tuples
+        delimiter (str): column separator of text lines. Defaults to "," for .csv files and any whitespace otherwise.
+        vertex_type (callable): converts vertex columns of text lines, for example int. Defaults to str.
+        chunk_size (int): number of edges in each chunk. Defaults to 100000.
+
+    Yields:
+        list: a list of at most chunk_size edge tuples
+
+    Description:
+        a text line looks like "start end" or "start end weight", lines starting with # are skipped
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if delimiter is None and os.fspath(source).lower().endswith(".csv"):
+            delimiter = ","
+        with open(source, newline="") as file:
+            yield from read_edges(file, delimiter, vertex_type, chunk_size)
+        return
+
+    iterator = iter(source)
+    first = next(iterator, None)
+    if first is None:
+        return
+    edges = _prepend(first, iterator)
+    if isinstance(first, str):
+        edges = _parse_lines(edges, delimiter, vertex_type)
+
+    chunk = []
+    for edge in edges:
+        chunk.append(edge)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _prepend(first, iterator):
+    """put an item back in front of an iterator
+
+    Args:
+        first (any): the item
+        iterator (iterator): the rest of the items
+
+    Yields:
+        any: first and then the items of iterator
+    """
+    yield first
+    yield from iterator
+
+
+def load_graph(source, graph_type: str, delimiter: str = None, vertex_type=str, chunk_size: int = 100000):
+    """build a graph from an edge list, vertices are taken from the edges
+
+    Args:
+        source (str | iterable): a file path, an iterable of text lines or an iterable of edge tuples
+        graph_type (str): "d" for directed and "ud" for undirected graphs
+        delimiter (str): column separator of text lines. Defaults to "," for .csv files and any whitespace otherwise.
+        vertex_type (callable): converts vertex columns of text lines, for example int. Defaults to str.
+        chunk_size (int): number of edges read and added at once. Defaults to 100000.
+
+    Returns:
+        Graph: the new graph
+    """
+    graph = Graph(set(), set(), graph_type)
+    for chunk in read_edges(source, delimiter, vertex_type, chunk_size):
+        graph.add_vertices(edge[0] for edge in chunk)
+        graph.add_vertices(edge[1] for edge in chunk)
+        graph.add_edges(chunk)
+    return graph
+
+
+def save_binary(graph, path):
+    """save a graph in the compact binary format, load it back with load_binary
+
+    Args:
+        graph (Graph | CSRGraph): the graph, a Graph is frozen first
+        path (str): the file path
+
+    Raises:
+        TypeError: if a vertex isn't an int or a str
+    """
+    if isinstance(graph, Graph):
+        graph = graph.freeze()
+    with open(path, "wb") as file:
+        for part in _parts(graph):
+            file.write(part)
+
+
+def pack(graph: CSRGraph):
+    """pack a frozen graph into bytes of the binary format
+
+    Args:
+        graph (CSRGraph): the graph
+
+    Raises:
+        TypeError: if a vertex isn't an int or a str
+
+    Returns:
+        bytes: the packed graph
+    """
+    return b"".join(_parts(graph))
+
+
+def _parts(graph: CSRGraph):
+    """make the pieces of the binary format: header, arrays and labels
+
+    Args:
+        graph (CSRGraph): the graph
+
+    Raises:
+        TypeError: if a vertex isn't an int or a str
+
+    Returns:
+        list: objects with the buffer protocol, in file order
+    """
+    for vertex in graph.V:
+        if type(vertex) not in (int, str):
+            raise TypeError("binary format only supports int and str vertices")
+    labels = json.dumps(list(graph.V)).encode()
+    flags = 0
+    if graph.type == "d":
+        flags |= _DIRECTED
+    weight_code = "d" if any(type(w) is float for w in graph.weights) else "q"
+    if weight_code == "d":
+        flags |= _FLOAT_WEIGHTS
+    if sys.byteorder == "big":
+        flags |= _BIG_ENDIAN
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, flags, graph.p, len(graph.targets), len(labels))]
+    for buffer, code in (
+        (graph.offsets, "q"),
+        (graph.targets, "q"),
+        (graph.weights, weight_code),
+        (graph.in_degrees, "q"),
+        (graph.out_degrees, "q"),
+    ):
+        # arrays and memoryviews of the right type are written without a copy
+        if not (isinstance(buffer, array) and buffer.typecode == code) and not (
+            isinstance(buffer, memoryview) and buffer.format == code
+        ):
+            buffer = array(code, buffer)
+        parts.append(buffer)
+    parts.append(labels)
+    return parts
+
+
+def unpack(buffer):
+    """make a CSRGraph that reads its arrays straight from a buffer of the binary format
+
+    Args:
+        buffer (buffer): bytes, mmap, shared memory or anything with the buffer protocol
+
+    Raises:
+        ValueError: if the buffer isn't a graph of this format
+
+    Returns:
+        CSRGraph: the graph, its arrays are views of the buffer so it must stay open
+    """
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise ValueError("not a pyStucture binary graph")
+    magic, version, flags, n, m, labels_size = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("not a pyStucture binary graph")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary graph version {version}")
+    if bool(flags & _BIG_ENDIAN) != (sys.byteorder == "big"):
+        raise ValueError("binary graph was saved with a different byte order")
+    # a truncated buffer would fail later with a less helpful error
+    if view.nbytes < _HEADER.size + (3 * n + 2 * m + 1) * 8 + labels_size:
+        raise ValueError("not a pyStucture binary graph")
+
+    sections = []
+    position = _HEADER.size
+    for count, code in ((n + 1, "q"), (m, "q"), (m, "d" if flags & _FLOAT_WEIGHTS else "q"), (n, "q"), (n, "q")):
+        end = position + count * 8
+        sections.append(view[position:end].cast(code))
+        position = end
+    labels = json.loads(bytes(view[position:position + labels_size]))
+    graph_type = "d" if flags & _DIRECTED else "ud"
+    return CSRGraph(labels, graph_type, *sections)
+
+
+def load_binary(path):
+    """memory-map a graph saved by save_binary
+
+    Args:
+        path (str): the file path
+
+    Returns:
+        CSRGraph: the graph, its edge arrays are read from the file on demand
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return unpack(mapped)
@@ -0,0 +1,274 @@
+from collections import OrderedDict
+
+from pyGraph import Graph
+from pyDisjointSet import DisjointSet
+from pyInterner import VertexInterner
+
+ROW_CACHE_SIZE = 64  # filtered rows a view keeps for each direction, so adj[i] and adj_w[i] filter once
+
+
+class _Rows:
+    """a read-only list of per vertex values that are computed when they are read
+    """
+
+    __slots__ = ("_row", "_size")
+
+    def __init__(self, row, size):
+        """Define needed variables for other methods
+
+        Args:
+            row (callable): id -> the value of that vertex
+            size (callable): () -> number of vertices
+        """
+        self._row = row
+        self._size = size
+
+    def __len__(self):
+        return self._size()
+
+    def __getitem__(self, i: int):
+        if not 0 <= i < self._size():
+            raise IndexError(i)
+        return self._row(i)
+
+    def __iter__(self):
+        return map(self._row, range(self._size()))
+
+
+class _Weights:
+    """the (start, end) -> weight lookups of a view, answered from its adjacency rows
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view):
+        self._view = view
+
+    def get(self, edge: tuple, default=None):
+        view = self._view
+        ids = view._interner.ids
+        i = ids.get(edge[0])
+        j = ids.get(edge[1])
+        if i is None or j is None:
+            return default
+        # parallel edges keep the lightest weight, like Graph._w
+        weights = [w for n, w in zip(view._adj[i], view._adj_w[i]) if n == j]
+        return min(weights) if weights else default
+
+    def __contains__(self, edge: tuple):
+        return self.get(edge) is not None
+
+    def __getitem__(self, edge: tuple):
+        weight = self.get(edge)
+        if weight is None:
+            raise KeyError(edge)
+        return weight
+
+
+class GraphView(Graph):
+    """a class for a read-only view of a graph that shares the graph's storage instead of copying it
+        make one like this: NAME = GRAPH.reversed(), GRAPH.subgraph(VERTICES) or GRAPH.edge_filter(PREDICATE)
+        views have the algorithm API of Graph and see later changes of the graph's edges
+    """
+
+    def __init__(self, parent: Graph, vertices=None, edge_filter=None, reverse: bool = False):
+        """Define needed variables for other methods
+
+        Args:
+            parent (Graph): the graph, or another view
+            vertices (iterable): keep only these vertices and the edges between them. Defaults to None.
+            edge_filter (callable): keep only edges where edge_filter((start, end, weight)) is True. Defaults to None.
+            reverse (bool): flip the direction of every edge. Defaults to False.
+
+        Raises:
+            NameError: if a vertex in vertices isn't in the graph
+
+        Description:
+            reverse is done first, so edge_filter sees the flipped edges. in an undirected graph
+            every edge is seen from both ends, so edge_filter shouldn't depend on their order
+        """
+        self._parent = parent
+        self._reverse = reverse and parent.type == "d"
+        self._filter = edge_filter
+        self.type = parent.type
+        if self._reverse:
+            # a reversed graph is the same lists with in and out swapped
+            adj, adj_w, radj, radj_w = parent._radj, parent._radj_w, parent._adj, parent._adj_w
+            out_degree, in_degree = parent._in_degree, parent._out_degree
+        else:
+            adj, adj_w, radj, radj_w = parent._adj, parent._adj_w, parent._radj, parent._radj_w
+            out_degree, in_degree = parent._out_degree, parent._in_degree
+
+        if vertices is None:
+            self._interner = parent._interner
+            self._parent_ids = None
+            self._view_ids = None
+            self._vertices = None
+        else:
+            vertices = set(vertices)
+            if not vertices <= parent.V:
+                raise NameError("Undefined vertex")
+            labels = parent._interner.labels
+            # view id -> parent id, in parent id order so BFS and DFS orders match the parent's
+            self._parent_ids = sorted(parent._interner.ids[vertex] for vertex in vertices)
+            self._view_ids = {p: i for i, p in enumerate(self._parent_ids)}  # parent id -> view id
+            self._interner = VertexInterner(labels[i] for i in self._parent_ids)
+            self._vertices = vertices
+
+        if self._parent_ids is None and edge_filter is None:
+            self._adj, self._adj_w, self._radj, self._radj_w = adj, adj_w, radj, radj_w
+            self._out_degree, self._in_degree = out_degree, in_degree
+        else:
+            size = self._interner.__len__
+            self._adj = _Rows(lambda i: self._row(adj, adj_w, i, False)[0], size)
+            self._adj_w = _Rows(lambda i: self._row(adj, adj_w, i, False)[1], size)
+            if self.type == "d":
+                self._radj = _Rows(lambda i: self._row(radj, radj_w, i, True)[0], size)
+                self._radj_w = _Rows(lambda i: self._row(radj, radj_w, i, True)[1], size)
+                self._out_degree = _Rows(lambda i: len(self._adj[i]), size)
+                self._in_degree = _Rows(lambda i: len(self._radj[i]), size)
+            else:
+                self._radj = self._adj
+                self._radj_w = self._adj_w
+                # a self-loop adds 2 to the degree of its vertex but is listed once
+                self._out_degree = _Rows(self._undirected_degree, size)
+                self._in_degree = self._out_degree
+        self._w = _Weights(self)
+
+        self._component_sets = None
+        self._component_version = -1
+        self._cache = OrderedDict()
+        self._cache_size = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._own_profiler = None  # set by set_profiler or profile of the view itself
+        self._rows = (OrderedDict(), OrderedDict())  # (out rows, in rows), view id -> (ids, weights)
+        self._rows_version = -1
+
+    @property
+    def _profiler(self):
+        # a view made before the graph's profiler was attached still records in it
+        if self._own_profiler is not None:
+            return self._own_profiler
+        return self._parent._profiler
+
+    @_profiler.setter
+    def _profiler(self, profiler):
+        # giving back the graph's profiler (the end of profile()) means follow the graph again
+        self._own_profiler = None if profiler is self._parent._profiler else profiler
+
+    def _row(self, adjacency, weights, i: int, incoming: bool):
+        """find the neighbors of a vertex that the view keeps, the last ROW_CACHE_SIZE rows are reused
+
+        Args:
+            adjacency (list): parent id -> parent ids of neighbors
+            weights (list): parent id -> weights of the edges in adjacency
+            i (int): view id of the vertex
+            incoming (bool): True when adjacency holds in-neighbors
+
+        Returns:
+            tuple: (view ids of the neighbors, weights of their edges)
+        """
+        version = self.version
+        if self._rows_version != version:
+            self._rows = (OrderedDict(), OrderedDict())
+            self._rows_version = version
+        rows = self._rows[incoming]
+        row = rows.get(i)
+        if row is not None:
+            rows.move_to_end(i)
+            return row
+        row = rows[i] = self._build_row(adjacency, weights, i, incoming)
+        if len(rows) > ROW_CACHE_SIZE:
+            rows.popitem(last=False)
+        return row
+
+    def _build_row(self, adjacency, weights, i: int, incoming: bool):
+        """find the neighbors of a vertex that the view keeps
+
+        Args:
+            adjacency (list): parent id -> parent ids of neighbors
+            weights (list): parent id -> weights of the edges in adjacency
+            i (int): view id of the vertex
+            incoming (bool): True when adjacency holds in-neighbors
+
+        Returns:
+            tuple: (view ids of the neighbors, weights of their edges)
+        """
+        view_ids = self._view_ids
+        edge_filter = self._filter
+        labels = self._interner.labels
+        label = labels[i]
+        p = i if view_ids is None else self._parent_ids[i]
+        ids = []
+        kept_weights = []
+        for j, w in zip(adjacency[p], weights[p]):
+            if view_ids is not None:
+                j = view_ids.get(j)
+                if j is None:
+                    continue
+            if edge_filter is not None:
+                other = labels[j]
+                if not edge_filter((other, label, w) if incoming else (label, other, w)):
+                    continue
+            ids.append(j)
+            kept_weights.append(w)
+        return ids, kept_weights
+
+    def _undirected_degree(self, i: int):
+        """the degree of a vertex of an undirected view, a self-loop adds 2 but is listed once
+        """
+        row = self._adj[i]
+        return len(row) + row.count(i)
+
+    @property
+    def version(self):
+        return self._parent.version
+
+    @property
+    def V(self):
+        return self._parent.V if self._vertices is None else self._vertices
+
+    @property
+    def E(self):
+        edges = self._parent.E
+        if self._reverse:
+            edges = {(e[1], e[0]) + tuple(e[2:]) for e in edges}
+        if self._vertices is not None:
+            edges = {e for e in edges if e[0] in self._vertices and e[1] in self._vertices}
+        if self._filter is not None:
+            edges = {e for e in edges if self._filter((e[0], e[1], e[2] if len(e) > 2 else 1))}
+        return edges
+
+    @property
+    def p(self):
+        return len(self._interner)
+
+    @property
+    def q(self):
+        if self._vertices is None and self._filter is None:
+            return self._parent.q
+        return len(self.E)
+
+    @property
+    def empty(self):
+        return self.q == 0
+
+    @property
+    def _components(self):
+        if self._vertices is None and self._filter is None:
+            return self._parent._components
+        # rebuilt from the rows the first time it is needed after the graph changes
+        if self._component_version != self.version:
+            components = DisjointSet(len(self._adj))
+            for i, row in enumerate(self._adj):
+                for j in row:
+                    components.union(i, j)
+            self._component_sets = components
+            self._component_version = self.version
+        return self._component_sets
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("graph views are read-only, change the graph instead")
+
+    add_edge = add_edges = add_vertex = add_vertices = _read_only
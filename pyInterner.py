@@ -0,0 +1,86 @@
+class VertexInterner:
+    """a class for giving hashable labels dense integer ids (0, 1, 2, ...) in the order they are added
+        you can define an interner like this: NAME = VertexInterner()
+    """
+
+    def __init__(self, labels=()):
+        """Define needed variables for other methods
+
+        Args:
+            labels (iterable): labels to add at the beginning. Defaults to ().
+        """
+        self.labels = []  # id -> label
+        self.ids = {}  # label -> id
+        for label in labels:
+            self.add(label)
+
+    def add(self, label):
+        """give a label an id, a label that already has one keeps it
+
+        Args:
+            label (any): a hashable label
+
+        Returns:
+            int: the id of the label
+        """
+        i = self.ids.get(label)
+        if i is None:
+            i = len(self.labels)
+            self.ids[label] = i
+            self.labels.append(label)
+        return i
+
+    def id(self, label):
+        """find the id of a label
+
+        Args:
+            label (any): the label
+
+        Raises:
+            KeyError: if the label wasn't added
+
+        Returns:
+            int: the id of the label
+        """
+        return self.ids[label]
+
+    def label(self, i: int):
+        """find the label of an id
+
+        Args:
+            i (int): the id
+
+        Returns:
+            any: the label
+        """
+        return self.labels[i]
+
+    def to_ids(self, labels):
+        """translate labels to ids
+
+        Args:
+            labels (iterable): labels that were added
+
+        Returns:
+            list: their ids
+        """
+        ids = self.ids
+        return [ids[label] for label in labels]
+
+    def to_labels(self, ids):
+        """translate ids to labels
+
+        Args:
+            ids (iterable): ids
+
+        Returns:
+            list: their labels
+        """
+        labels = self.labels
+        return [labels[i] for i in ids]
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.ids
@@ -1,33 +1,59 @@
 from pyStack import Node
 
 
+class DoubleNode(Node):
+    """a node that also knows the node before it
+    """
+
+    __slots__ = ("prev",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.prev = None  # the previous node
+
+
 class LinkedList:
     """a class for saving linked list and give you linked list data structure
         you can define a linked list like this: NAME = LinkedList()
     """
 
-    def __init__(self):
+    def __init__(self, elements=()):
         """Define needed variables for other methods
+
+        Args:
+            elements (iterable): elements to put in the list at the beginning. Defaults to ().
         """
-        self.root = Node(None)  # the first node
+        self.root = None  # the first node
+        self.tail = None  # the last node
         self.length = 0  # length of linked list
+        self.extend(elements)
 
     def get_obj(self, index: int):
-        """get the node object in specific index
+        """get the node object in specific index, the walk starts from the nearer end
+            algorithm time complexity = O(min(index, length - index))
 
         Args:
-            index (int): index of the node object
+            index (int): index of the node object, negative indexes count from the end
+
+        Raises:
+            IndexError: if the index was out of range
 
         Returns:
-            Node: the node object
+            DoubleNode: the node object
         """
-        if self.length == 1:
-            return self.root
-        else:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("linked list index out of range")
+        if index <= self.length // 2:
             node = self.root
             for i in range(index):
                 node = node.link
-            return node
+        else:
+            node = self.tail
+            for i in range(self.length - 1 - index):
+                node = node.prev
+        return node
 
     def is_empty(self):
         """check the list is empty or not
@@ -49,18 +75,34 @@ class LinkedList:
         return self.get_obj(index).data
 
     def put(self, new_element):
-        """put a new element in list
+        """put a new element at the end of the list
+            algorithm time complexity = O(1)
 
         Args:
             new_element (any): the new element
         """
-        if self.root.data is None:
-            self.root.data = new_element
+        node = DoubleNode(new_element)
+        if self.tail is None:
+            self.root = node
         else:
-            last_element = self.get_obj(self.length - 1)
-            last_element.link = Node(new_element)
+            node.prev = self.tail
+            self.tail.link = node
+        self.tail = node
         self.length += 1
 
+    def append(self, new_element):
+        self.put(new_element)
+
+    def extend(self, elements):
+        """put many elements at the end of the list
+            algorithm time complexity = O(k) for k elements
+
+        Args:
+            elements (iterable): the new elements
+        """
+        for element in elements:
+            self.put(element)
+
     def show(self):
         """print the list values
         """
@@ -68,9 +110,8 @@ class LinkedList:
         red = "\033[91m text \033[00m"
         yellow = "\033[93m text \033[00m"
         cyan = "\033[96m text \033[00m"
-        elements = [self.get(i) for i in range(self.length)]
         print(red.replace("text", "("))
-        for element in elements:
+        for element in self:
             type_ = type(element)
             if type_ == int or type_ == float:
                 print(yellow.replace("text", f"\t{element},"))
@@ -84,6 +125,7 @@ class LinkedList:
 
     def count(self, value):
         """count how many elements like value exist
+            algorithm time complexity = O(n)
 
         Args:
             value (any): the value you want to count
@@ -92,8 +134,7 @@ class LinkedList:
             int: a number to show how many times the value repeated
         """
         number = 0
-        for i in range(self.length):
-            element = self.get(i)
+        for element in self:
             if element == value:
                 number += 1
         return number
@@ -102,12 +143,13 @@ class LinkedList:
         """
         empty the list
         """
-        del self.root
-        self.root = Node(None)
+        self.root = None
+        self.tail = None
         self.length = 0
 
     def pop(self, index: int = -1):
         """remove and return the index
+            algorithm time complexity = O(1) at both ends, O(min(index, length - index)) in the middle
 
         Args:
             index (int): index of element you want to remove. Defaults to -1.
@@ -120,11 +162,36 @@ class LinkedList:
         """
         if self.length == 0:
             raise IndexError("pop from empty stack")
-        if index == -1:
-            index = self.length - 1
-        value = self.get(index)
-        before = self.get_obj(index - 1)
-        after = self.get_obj(index + 1)
-        before.link = after
+        node = self.get_obj(index)
+        before, after = node.prev, node.link
+        if before is None:
+            self.root = after
+        else:
+            before.link = after
+        if after is None:
+            self.tail = before
+        else:
+            after.prev = before
         self.length -= 1
-        return value
+        return node.data
+
+    def __iter__(self):
+        node = self.root
+        while node is not None:
+            yield node.data
+            node = node.link
+
+    def __reversed__(self):
+        node = self.tail
+        while node is not None:
+            yield node.data
+            node = node.prev
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, value):
+        for element in self:
+            if element == value:
+                return True
+        return False
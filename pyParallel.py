@@ -0,0 +1,153 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from pyCSRGraph import CSRGraph
+
+
+_worker_graph = None  # the graph of a worker process, set once by _init_worker
+_worker_shared = None  # the SharedGraph handle when the graph came through shared memory
+
+
+def _portable(graph):
+    """make a CSRGraph that can be sent to other processes
+
+    Args:
+        graph (Graph | CSRGraph): the graph
+
+    Returns:
+        CSRGraph: a graph whose buffers are plain arrays
+    """
+    if not isinstance(graph, CSRGraph):
+        return graph.freeze()
+    buffers = [graph.offsets, graph.targets, graph.weights, graph.in_degrees, graph.out_degrees]
+    if all(isinstance(buffer, array) for buffer in buffers):
+        return graph
+    # memoryviews of a mapped file or shared memory can't be pickled, copy them once
+    codes = ["q", "q", "d" if any(type(w) is float for w in graph.weights) else "q", "q", "q"]
+    return CSRGraph(graph.V, graph.type, *(array(code, buffer) for code, buffer in zip(codes, buffers)))
+
+
+def _init_worker(graph):
+    """keep the graph in the worker process for all its tasks
+
+    Args:
+        graph (CSRGraph | str): the graph, or the name of the shared memory block that holds it
+    """
+    global _worker_graph, _worker_shared
+    if isinstance(graph, str):
+        from pySharedGraph import attach_graph
+
+        _worker_shared = attach_graph(graph)
+        graph = _worker_shared.graph
+    _worker_graph = graph
+
+
+def _distances(graph: CSRGraph, sources):
+    """run dijkstra from some sources
+
+    Args:
+        graph (CSRGraph): the graph
+        sources (list): ids of the sources
+
+    Returns:
+        list: (source, distances) tuples, distances is a dict of the reachable vertices
+    """
+    labels = graph.V
+    inf = float("inf")
+    rows = []
+    for source in sources:
+        dist, _ = graph._search(source)
+        rows.append((labels[source], {labels[i]: d for i, d in enumerate(dist) if d != inf}))
+    return rows
+
+
+def _solve(sources):
+    """the task of a worker process
+
+    Args:
+        sources (list): ids of the sources
+
+    Returns:
+        list: (source, distances) tuples
+    """
+    return _distances(_worker_graph, sources)
+
+
+def multi_source_dijkstra(graph, sources, workers: int = None, chunk_size: int = None):
+    """run dijkstra from many sources on a pool of processes
+        algorithm time complexity = O(S * (V + E) * log(V) / workers)
+
+    Args:
+        graph (Graph | CSRGraph): the graph
+        sources (iterable): the source vertices
+        workers (int): number of processes, 1 runs in this process. Defaults to the number of CPUs.
+        chunk_size (int): sources in one task. Defaults to about 4 tasks per worker.
+
+    Yields:
+        tuple: (source, distances) in the order of sources, distances is a dict of the reachable
+            vertices and their distance from source
+
+    Description:
+        the graph is frozen and put in shared memory once, workers read it without copying.
+        graphs with vertices that aren't ints or strs are sent to each worker once, when it starts.
+        tasks only carry source ids, and only about 2 tasks per worker are submitted ahead of
+        the caller, so the results wait in memory only as long as the caller is busy with them
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.freeze()
+    sources = [graph.ids[source] for source in sources]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(sources) // (workers * 4))
+    if workers <= 1 or len(sources) <= 1:
+        for start in range(0, len(sources), chunk_size):
+            yield from _distances(graph, sources[start:start + chunk_size])
+        return
+    chunks = (sources[start:start + chunk_size] for start in range(0, len(sources), chunk_size))
+
+    # imported here because pySharedGraph needs pyGraphIO, which needs pyGraph, which needs this module
+    from pySharedGraph import share_graph
+
+    try:
+        shared = share_graph(graph)
+    except TypeError:
+        shared = None
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(_portable(graph) if shared is None else shared.name,)
+    )
+    try:
+        # only about 2 tasks per worker are in flight, so results of a slow consumer don't pile up
+        pending = deque()
+        for chunk in islice(chunks, 2 * workers):
+            pending.append(executor.submit(_solve, chunk))
+        while pending:
+            rows = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_solve, chunk))
+            yield from rows
+    finally:
+        # also runs when the caller stops early, tasks that didn't start are dropped
+        executor.shutdown(wait=True, cancel_futures=True)
+        if shared is not None:
+            shared.unlink()
+
+
+def all_pairs_shortest_paths(graph, workers: int = None, chunk_size: int = None):
+    """find the distance between every pair of vertices on a pool of processes
+
+    Args:
+        graph (Graph | CSRGraph): the graph
+        workers (int): number of processes, 1 runs in this process. Defaults to the number of CPUs.
+        chunk_size (int): sources in one task. Defaults to about 4 tasks per worker.
+
+    Yields:
+        tuple: (source, distances) for every vertex, see multi_source_dijkstra
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.freeze()
+    yield from multi_source_dijkstra(graph, graph.V, workers, chunk_size)
@@ -0,0 +1,255 @@
+class _Entry:
+    """an element of the heap, its index is kept up to date so it can be found in O(1)
+    """
+
+    __slots__ = ("priority", "key", "index")
+
+    def __init__(self, priority, key, index: int):
+        self.priority = priority
+        self.key = key
+        self.index = index  # position in the heap list
+
+
+class PriorityQueue:
+    """a class for saving priority queue (an indexed binary min-heap) and give you priority queue data structure
+        you can define a priority queue like this: NAME = PriorityQueue() or NAME = PriorityQueue(ITEMS)
+        every key is in the queue at most once, so its priority can be changed in O(log(n))
+    """
+
+    def __init__(self, items=()):
+        """Define needed variables for other methods
+
+        Args:
+            items (iterable): (key, priority) pairs to start with, they are heapified in O(n). Defaults to ().
+        """
+        self._heap = []  # entries, the smallest priority at index 0
+        self._entries = {}  # key -> entry
+        self.length = 0
+        self.heapify(items)
+
+    def heapify(self, items):
+        """add many (key, priority) pairs at once and rebuild the heap bottom-up
+            algorithm time complexity = O(n)
+
+        Args:
+            items (iterable): the pairs, a key that is already in the queue gets the new priority
+        """
+        heap = self._heap
+        entries = self._entries
+        for key, priority in items:
+            entry = entries.get(key)
+            if entry is None:
+                entry = _Entry(priority, key, len(heap))
+                entries[key] = entry
+                heap.append(entry)
+            else:
+                entry.priority = priority
+        self.length = len(heap)
+        for i in reversed(range(len(heap) // 2)):
+            self._sift_down(i)
+
+    def _sift_up(self, i: int):
+        """move the entry at index i up until its parent isn't bigger
+
+        Args:
+            i (int): index in the heap
+        """
+        heap = self._heap
+        entry = heap[i]
+        priority = entry.priority
+        while i:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if not priority < above.priority:
+                break
+            heap[i] = above
+            above.index = i
+            i = parent
+        heap[i] = entry
+        entry.index = i
+
+    def _sift_down(self, i: int):
+        """move the entry at index i down until its children aren't smaller
+
+        Args:
+            i (int): index in the heap
+        """
+        heap = self._heap
+        size = len(heap)
+        entry = heap[i]
+        priority = entry.priority
+        child = 2 * i + 1
+        while child < size:
+            right = child + 1
+            if right < size and heap[right].priority < heap[child].priority:
+                child = right
+            below = heap[child]
+            if not below.priority < priority:
+                break
+            heap[i] = below
+            below.index = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = entry
+        entry.index = i
+
+    def put(self, key, priority):
+        """put a key in the queue, or change its priority if it is already there
+            algorithm time complexity = O(log(n))
+
+        Args:
+            key (any): a hashable key
+            priority (any): its priority, smaller comes out first
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._change(entry, priority)
+            return
+        entry = _Entry(priority, key, len(self._heap))
+        self._entries[key] = entry
+        self._heap.append(entry)
+        self.length += 1
+        self._sift_up(entry.index)
+
+    def push(self, key, priority):
+        self.put(key, priority)
+
+    def _change(self, entry: _Entry, priority):
+        """give an entry a new priority and fix its place in the heap
+
+        Args:
+            entry (_Entry): the entry
+            priority (any): the new priority
+        """
+        old = entry.priority
+        entry.priority = priority
+        if priority < old:
+            self._sift_up(entry.index)
+        else:
+            self._sift_down(entry.index)
+
+    def decrease_key(self, key, priority):
+        """make the priority of a key smaller
+            algorithm time complexity = O(log(n))
+
+        Args:
+            key (any): a key in the queue
+            priority (any): the new priority
+
+        Raises:
+            KeyError: if the key isn't in the queue
+            ValueError: if the new priority is bigger than the old one
+        """
+        entry = self._entries[key]
+        if entry.priority < priority:
+            raise ValueError("the new priority is bigger than the old one")
+        entry.priority = priority
+        self._sift_up(entry.index)
+
+    def get(self):
+        """give you the key with the smallest priority and remove it
+            algorithm time complexity = O(log(n))
+
+        Returns:
+            tuple: (key, priority)
+        """
+        if not self.length:
+            self.show_error()
+        entry = self._remove_at(0)
+        return entry.key, entry.priority
+
+    def pop(self):
+        return self.get()
+
+    def peek(self):
+        """give you the key with the smallest priority without removing it
+
+        Returns:
+            tuple: (key, priority)
+        """
+        if not self.length:
+            self.show_error()
+        entry = self._heap[0]
+        return entry.key, entry.priority
+
+    def remove(self, key):
+        """remove a key from the queue
+            algorithm time complexity = O(log(n))
+
+        Args:
+            key (any): a key in the queue
+
+        Raises:
+            KeyError: if the key isn't in the queue
+
+        Returns:
+            any: the priority it had
+        """
+        return self._remove_at(self._entries[key].index).priority
+
+    def _remove_at(self, i: int):
+        """take the entry at index i out of the heap
+
+        Args:
+            i (int): index in the heap
+
+        Returns:
+            _Entry: the removed entry
+        """
+        heap = self._heap
+        entry = heap[i]
+        last = heap.pop()
+        self.length -= 1
+        del self._entries[entry.key]
+        if last is not entry:
+            # the last entry fills the hole and moves to its place
+            heap[i] = last
+            last.index = i
+            if i and last.priority < heap[(i - 1) >> 1].priority:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return entry
+
+    def priority(self, key):
+        """return the priority of a key
+
+        Args:
+            key (any): a key in the queue
+
+        Raises:
+            KeyError: if the key isn't in the queue
+
+        Returns:
+            any: its priority
+        """
+        return self._entries[key].priority
+
+    def clear(self):
+        """clear the priority queue
+        """
+        self._heap = []
+        self._entries = {}
+        self.length = 0
+
+    def is_empty(self):
+        """check the priority queue is empty or not
+
+        Returns:
+            boolean: if it was True, the priority queue is empty
+        """
+        return not self.length
+
+    def show_error(self):
+        """show an error
+
+        Raises:
+            IndexError: when you get from empty priority queue this error raise
+        """
+        raise IndexError("can't 'get' from empty priority queue")
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return self.length
@@ -0,0 +1,114 @@
+from functools import wraps
+from time import perf_counter
+
+
+COUNTERS = ("neighbor_expansions", "edge_scans", "relaxations", "queue_pushes", "queue_pops")
+
+
+class GraphProfiler:
+    """a class for counting the work graph algorithms do
+        attach it to a graph like this: with GRAPH.profile() as NAME: ...
+    """
+
+    def __init__(self, callback=None):
+        """Define needed variables for other methods
+
+        Args:
+            callback (callable): called after every profiled algorithm call with
+                (algorithm name, seconds, counters of that call). Defaults to None.
+
+        Description:
+            counters include:
+                neighbor_expansions : vertices whose neighbors were looked at
+                edge_scans : neighbor entries looked at
+                relaxations : distances improved by dijkstra
+                queue_pushes : items put in a queue, stack or heap
+                queue_pops : items taken from a queue, stack or heap
+        """
+        self.callback = callback
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.calls = {}  # algorithm name -> {"calls": n, "time": seconds}
+
+    def expand(self, scans: int):
+        """count one neighbor expansion
+
+        Args:
+            scans (int): number of neighbor entries of the expanded vertex
+        """
+        counters = self.counters
+        counters["neighbor_expansions"] += 1
+        counters["edge_scans"] += scans
+
+    def count(self, name: str, amount: int = 1):
+        """add to a counter
+
+        Args:
+            name (str): the counter name
+            amount (int): how much to add. Defaults to 1.
+        """
+        self.counters[name] += amount
+
+    def run(self, name: str, function, *args, **kwargs):
+        """call an algorithm and record its time and counters
+
+        Args:
+            name (str): the algorithm name
+            function (callable): the algorithm
+
+        Returns:
+            any: what the algorithm returned
+        """
+        before = dict(self.counters)
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - started
+            call = self.calls.setdefault(name, {"calls": 0, "time": 0.0})
+            call["calls"] += 1
+            call["time"] += elapsed
+            if self.callback is not None:
+                delta = {key: self.counters[key] - before[key] for key in COUNTERS}
+                self.callback(name, elapsed, delta)
+
+    def report(self):
+        """give you everything counted so far
+
+        Returns:
+            dict: counters and per algorithm calls and time
+        """
+        return {
+            "counters": dict(self.counters),
+            "calls": {name: dict(call) for name, call in self.calls.items()},
+        }
+
+    def reset(self):
+        """set every counter back to 0
+        """
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.calls = {}
+
+
+def profiled(method):
+    """make a graph method record its calls in the graph's profiler, if it has one
+
+    Args:
+        method (callable): the method
+
+    Returns:
+        callable: the wrapped method
+
+    Description:
+        without a profiler the only cost is one attribute check per call. the time of
+        nested profiled calls is counted in the outer call as well
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = self._profiler
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        return profiler.run(name, method, self, *args, **kwargs)
+
+    return wrapper
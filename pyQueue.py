@@ -5,8 +5,16 @@ class Queue(Stack):
     """a class for saving queue and give you queue data structure
     """
 
+    def __init__(self):
+        """Define needed variables for other methods
+        """
+        self.first = Node(None)
+        self.last = self.first  # the tail node, new elements are linked after it
+        self.length = 0
+
     def put(self, value):
         """put a new element to queue
+            algorithm time complexity = O(1)
 
         Args:
             value (any): the new element value
@@ -14,12 +22,169 @@ class Queue(Stack):
         if not self.length:
             self.first.data = value
         else:
-            node = self.first
-            for i in range(self.length - 1):
-                node = node.link
-            node.link = Node(value)
+            node = Node(value)
+            self.last.link = node
+            self.last = node
+        self.length += 1
+
+    def push_many(self, values):
+        """put many elements to queue, in their order
+
+        Args:
+            values (iterable): the new elements
+        """
+        for value in values:
+            self.put(value)
+
+    def get(self):
+        """give you the first element and remove it
+            algorithm time complexity = O(1)
+
+        Returns:
+            any: the first element
+        """
+        value = self.first.data
+        if not self.length:
+            self.show_error()
+        elif self.length == 1:
+            self.first.data = None
+        else:
+            self.first = self.first.link
+        self.length -= 1
+        return value
+
+    def pop_many(self, k: int):
+        """remove up to k elements from the front
+
+        Args:
+            k (int): number of elements
+
+        Returns:
+            list: the removed elements, in queue order
+        """
+        return [self.get() for _ in range(min(k, self.length))]
+
+    def clear(self):
+        """clear the queue
+        """
+        self.first = Node(None)
+        self.last = self.first
+        self.length = 0
+
+    def _values(self):
+        node = self.first
+        for _ in range(self.length):
+            yield node.data
+            node = node.link
+
+    def show_error(self):
+        """show an error
+
+        Raises:
+            IndexError: when you get from empty queue this error raise
+        """
+        raise IndexError("can't 'get' from empty queue")
+
+
+class RingQueue:
+    """a class for a queue saved in a growable circular buffer instead of linked nodes
+        you can define a ring queue like this: NAME = RingQueue() or NAME = RingQueue(CAPACITY)
+    """
+
+    def __init__(self, capacity: int = None, size: int = 16):
+        """Define needed variables for other methods
+
+        Args:
+            capacity (int): the most elements the queue can hold, None means no limit. Defaults to None.
+            size (int): number of slots at the beginning, the buffer doubles when it is full. Defaults to 16.
+
+        Raises:
+            ValueError: if capacity was smaller than 1
+        """
+        if capacity is not None:
+            if capacity < 1:
+                raise ValueError("capacity must be at least 1")
+            size = min(size, capacity)
+        self.capacity = capacity
+        self._items = [None] * max(size, 1)
+        self._head = 0  # slot of the first element
+        self.length = 0
+
+    def _grow(self):
+        """double the buffer, the elements move to the beginning of the new one
+        """
+        items = self._items
+        size = len(items) * 2
+        if self.capacity is not None:
+            size = min(size, self.capacity)
+        if size <= len(items):
+            raise IndexError("can't 'put' to a full queue")
+        self._items = items[self._head:] + items[:self._head] + [None] * (size - len(items))
+        self._head = 0
+
+    def put(self, value):
+        """put a new element to queue
+            algorithm time complexity = O(1) amortized
+
+        Args:
+            value (any): the new element value
+
+        Raises:
+            IndexError: when the queue already has capacity elements
+        """
+        if self.length == len(self._items):
+            if self.length == self.capacity:
+                raise IndexError("can't 'put' to a full queue")
+            self._grow()
+        items = self._items
+        items[(self._head + self.length) % len(items)] = value
         self.length += 1
 
+    def push(self, value):
+        self.put(value)
+
+    def get(self):
+        """give you the first element and remove it
+            algorithm time complexity = O(1)
+
+        Returns:
+            any: the first element
+        """
+        if not self.length:
+            self.show_error()
+        items = self._items
+        value = items[self._head]
+        items[self._head] = None  # don't keep the element alive
+        self._head = (self._head + 1) % len(items)
+        self.length -= 1
+        return value
+
+    def pop(self):
+        return self.get()
+
+    def clear(self):
+        """clear the queue
+        """
+        self._items = [None] * len(self._items)
+        self._head = 0
+        self.length = 0
+
+    def is_empty(self):
+        """check the queue is empty or not
+
+        Returns:
+            boolean: if it was True, the queue is empty
+        """
+        return not self.length
+
+    def is_full(self):
+        """check the queue has capacity elements
+
+        Returns:
+            boolean: if it was True, put will raise an error
+        """
+        return self.length == self.capacity
+
     def show_error(self):
         """show an error
 
@@ -27,3 +192,23 @@ class Queue(Stack):
             IndexError: when you get from empty queue this error raise
         """
         raise IndexError("can't 'get' from empty queue")
+
+    def count(self, value):
+        """count the elements that are equal to value
+
+        Args:
+            value (any): the value
+
+        Returns:
+            int: number of the elements
+        """
+        items = self._items
+        size = len(items)
+        n = 0
+        for i in range(self.length):
+            if items[(self._head + i) % size] == value:
+                n += 1
+        return n
+
+    def __len__(self):
+        return self.length
@@ -0,0 +1,99 @@
+from multiprocessing import shared_memory
+
+from pyGraphIO import _parts, unpack
+
+
+class SharedGraph:
+    """a class for a read-only graph that lives in shared memory and can be used by many processes
+        export a graph like this: NAME = share_graph(GRAPH) and attach to it in another
+        process like this: NAME = attach_graph(NAME.name)
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """Define needed variables for other methods
+
+        Args:
+            memory (SharedMemory): the shared memory block that holds the graph
+            owner (bool): True for the process that made the block, only it unlinks the block
+        """
+        self.memory = memory
+        self.owner = owner
+        self.name = memory.name
+        # a CSRGraph whose arrays are read-only views of the block
+        self.graph = unpack(memory.buf.toreadonly())
+
+    def __getattr__(self, name):
+        # neighboring_vertices, bfs, dijkstra and the rest of the CSRGraph API
+        if name == "graph":
+            raise AttributeError(name)
+        return getattr(self.graph, name)
+
+    def close(self):
+        """stop using the block in this process, the graph can't be used after this
+        """
+        graph = self.__dict__.pop("graph", None)
+        if graph is not None:
+            for buffer in (graph.offsets, graph.targets, graph.weights, graph.in_degrees, graph.out_degrees):
+                buffer.release()
+        self.memory.close()
+
+    def unlink(self):
+        """close the block and free it for every process, only the owner should call this
+        """
+        self.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+def share_graph(graph, name: str = None):
+    """copy a graph into a new shared memory block
+
+    Args:
+        graph (Graph | CSRGraph): the graph, a Graph is frozen first
+        name (str): name of the block. Defaults to a random name.
+
+    Raises:
+        TypeError: if a vertex isn't an int or a str
+
+    Returns:
+        SharedGraph: the owner handle, call unlink() (or use it in a with block) to free the block
+    """
+    if not hasattr(graph, "offsets"):
+        graph = graph.freeze()
+    parts = [memoryview(part).cast("B") for part in _parts(graph)]
+    size = sum(part.nbytes for part in parts)
+    memory = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+    position = 0
+    for part in parts:
+        memory.buf[position:position + part.nbytes] = part
+        position += part.nbytes
+    return SharedGraph(memory, owner=True)
+
+
+def attach_graph(name: str):
+    """use a graph that another process put in shared memory, without copying it
+
+    Args:
+        name (str): name of the block, the name attribute of the owner's SharedGraph
+
+    Returns:
+        SharedGraph: the handle, call close() when you are done
+
+    Description:
+        before python 3.13 the resource tracker of a process that isn't a child of the owner
+        may free the block when that process exits, so attach from child processes there
+    """
+    try:
+        memory = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # python < 3.13 has no track argument
+        memory = shared_memory.SharedMemory(name=name)
+    return SharedGraph(memory, owner=False)
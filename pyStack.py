@@ -1,7 +1,12 @@
+from array import array
+
+
 class Node:
     """a class to make data structures
     """
 
+    __slots__ = ("data", "link")  # no per node __dict__, a node is just its two fields
+
     def __init__(self, data):
         self.data = data  # store a data in the node
         self.link = None  # the next node
@@ -9,56 +14,84 @@ class Node:
 
 class Stack:
     """a class for saving stack and give you stack data structure
+        elements are kept in a python list, or in a typed array like this: NAME = Stack("q")
     """
 
-    def __init__(self):
+    def __init__(self, typecode: str = None):
         """Define needed variables for other methods
+
+        Args:
+            typecode (str): an array typecode ("q", "d", ...) to keep numbers compactly, None keeps
+                any objects. Defaults to None.
         """
-        self.first = Node(None)
+        self._items = [] if typecode is None else array(typecode)  # the top is at the end
         self.length = 0
 
     def put(self, value):
         """put a new element in the stack
+            algorithm time complexity = O(1) amortized
 
         Args:
             value (any): the new value you want to put in stack
         """
-        if not self.length:
-            self.first.data = value
-        else:
-            new_node = Node(value)
-            new_node.link = self.first
-            self.first = new_node
+        self._items.append(value)
         self.length += 1
 
     def push(self, value):
         self.put(value)
 
+    def push_many(self, values):
+        """put many elements in the stack, the last one ends up on top
+
+        Args:
+            values (iterable): the new values
+        """
+        items = self._items
+        try:
+            items.extend(values)
+        finally:
+            # extend can stop partway (a bad value for the array, an error in the iterable)
+            self.length = len(items)
+
     def get(self):
         """give you the first element and remove it
+            algorithm time complexity = O(1)
 
         Returns:
-            any: the first element 
+            any: the first element
         """
-        value = self.first.data
         if not self.length:
             self.show_error()
-        elif self.length == 1:
-            self.first.data = None
-        else:
-            self.first = self.first.link
         self.length -= 1
-        return value
+        return self._items.pop()
 
     def pop(self):
         return self.get()
 
+    def pop_many(self, k: int):
+        """remove up to k elements from the top
+
+        Args:
+            k (int): number of elements
+
+        Returns:
+            list: the removed elements, the top one first
+        """
+        items = self._items
+        k = min(k, len(items))
+        if k <= 0:
+            return []
+        values = items[-k:].tolist() if isinstance(items, array) else items[-k:]
+        del items[-k:]
+        values.reverse()
+        self.length = len(items)
+        return values
+
     def clear(self):
         """clear the stack
         """
-        del self.first
+        del self._items[:]
         self.length = 0
-        self.first = Node(None)
 
     def is_empty(self):
         """check the stack is empty or not
@@ -76,6 +109,14 @@ class Stack:
         """
         raise IndexError("Stack overflow")
 
+    def _values(self):
+        """give the elements from the first one that get returns to the last one
+
+        Returns:
+            iterable: the elements
+        """
+        return reversed(self._items)
+
     def show(self):
         """print the stack values
         """
@@ -84,25 +125,21 @@ class Stack:
         yellow = "\033[93m text \033[00m"
         cyan = "\033[96m text \033[00m"
         print(red.replace("text", "("))
-        node = self.first
-        for i in range(self.length):
-            type_ = type(node.data)
+        for value in self._values():
+            type_ = type(value)
             if type_ == int or type_ == float:
-                print(yellow.replace("text", f"\t{node.data},"))
+                print(yellow.replace("text", f"\t{value},"))
             elif type_ == str:
-                print(green.replace("text", f"\t'{node.data}',"))
+                print(green.replace("text", f"\t'{value}',"))
             elif type_ == list or type_ == tuple or type_ == set or type_ == dict:
-                print(cyan.replace("text", f"\t{node.data},"))
+                print(cyan.replace("text", f"\t{value},"))
             else:
-                print(f"\t{node},")
-            node = node.link
+                print(f"\t{value},")
         print(red.replace("text", ")\n"))
 
     def count(self, value):
         n = 0
-        node = self.first
-        for i in range(self.length):
-            if node.data == value:
+        for item in self._values():
+            if item == value:
                 n += 1
-            node = node.link
         return n